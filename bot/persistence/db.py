@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Iterable
-
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from operator import itemgetter
+from typing import Any, Iterable, Mapping, Sequence
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Integer,
+    String,
+    bindparam,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
 from .engine import async_session_maker
@@ -26,8 +37,200 @@ from .models import (
 # Helper types / constants
 # -------------------------------------------------------------------
 
+# Keep in sync with the ix_orders_open_lookup partial index predicate.
 OPEN_ORDER_STATUSES = ("open", "pending", "partially_filled")
 
+_UTC = timezone.utc
+
+
+def _as_utc(dt: datetime | None) -> datetime | None:
+    """
+    Cheap hot-path normalization: only naive datetimes need work, since
+    timestamptz stores aware values as an absolute instant anyway.
+    """
+    if dt is None or dt.tzinfo is not None:
+        return dt
+    return dt.replace(tzinfo=_UTC)
+
+CANDLE_COLUMNS = (
+    "asset_id",
+    "timeframe",
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "source",
+)
+
+# Candle batches are bound as one array per column and expanded server-side
+# with unnest(), so the statement has nine parameters regardless of batch size.
+# The statement shape never changes, so it is built once at import time.
+_CANDLE_ARRAY_PARAMS = (
+    bindparam("asset_id", type_=ARRAY(Integer)),
+    bindparam("timeframe", type_=ARRAY(String)),
+    bindparam("timestamp", type_=ARRAY(DateTime(timezone=True))),
+    bindparam("open", type_=ARRAY(Float)),
+    bindparam("high", type_=ARRAY(Float)),
+    bindparam("low", type_=ARRAY(Float)),
+    bindparam("close", type_=ARRAY(Float)),
+    bindparam("volume", type_=ARRAY(Float)),
+    bindparam("source", type_=ARRAY(String)),
+)
+
+_CANDLE_UNNEST_INSERT = """
+    INSERT INTO candles (
+        asset_id, timeframe, timestamp, open, high, low, close, volume, source
+    )
+    SELECT * FROM unnest(
+        :asset_id, :timeframe, :timestamp,
+        :open, :high, :low, :close, :volume,
+        :source
+    )
+"""
+
+_INSERT_CANDLES_STMT = text(_CANDLE_UNNEST_INSERT).bindparams(
+    *_CANDLE_ARRAY_PARAMS
+)
+
+_UPSERT_CANDLES_STMT = text(
+    _CANDLE_UNNEST_INSERT
+    + """
+    ON CONFLICT (asset_id, timeframe, timestamp) DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume,
+        source = EXCLUDED.source
+"""
+).bindparams(*_CANDLE_ARRAY_PARAMS)
+
+
+_INSERT_CANDLES_SKIP_STMT = text(
+    _CANDLE_UNNEST_INSERT
+    + """
+    ON CONFLICT (asset_id, timeframe, timestamp) DO NOTHING
+"""
+).bindparams(*_CANDLE_ARRAY_PARAMS)
+
+# Rows per statement for bulk_insert_candles; large enough to amortize the
+# round-trip, small enough to keep each array bind well under memory limits.
+CANDLE_BATCH_SIZE = 5000
+
+
+# COPY-based backfill: stream rows into a per-transaction staging table,
+# then merge into candles skipping rows that already exist.
+_CANDLE_STAGE_DDL = """
+    CREATE TEMP TABLE candles_stage (
+        asset_id integer,
+        timeframe varchar,
+        timestamp timestamptz,
+        open double precision,
+        high double precision,
+        low double precision,
+        close double precision,
+        volume double precision,
+        source varchar
+    ) ON COMMIT DROP
+"""
+
+_CANDLE_STAGE_COPY = (
+    "COPY candles_stage (" + ", ".join(CANDLE_COLUMNS) + ") "
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+
+_CANDLE_STAGE_COPY_TYPES = (
+    "int4",
+    "varchar",
+    "timestamptz",
+    "float8",
+    "float8",
+    "float8",
+    "float8",
+    "float8",
+    "varchar",
+)
+
+_CANDLE_STAGE_MERGE = (
+    "INSERT INTO candles (" + ", ".join(CANDLE_COLUMNS) + ") "
+    "SELECT " + ", ".join(CANDLE_COLUMNS) + " FROM candles_stage "
+    "ON CONFLICT (asset_id, timeframe, timestamp) DO NOTHING"
+)
+
+
+_CANDLE_PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _as_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+_candle_row = itemgetter(*CANDLE_COLUMNS)
+
+
+def _candle_copy_row(c: Mapping[str, Any]) -> tuple[Any, ...]:
+    """
+    One candle dict as a binary COPY row for candles_stage.
+
+    Binary COPY sends values exactly as typed, so naive timestamps are
+    made UTC-aware here (timestamptz) and prices coerced to float8, the
+    same normalization the INSERT paths apply.
+    """
+    return (
+        c["asset_id"],
+        c["timeframe"],
+        _as_utc(c["timestamp"]),
+        _as_float(c.get("open")),
+        _as_float(c.get("high")),
+        _as_float(c.get("low")),
+        _as_float(c.get("close")),
+        _as_float(c.get("volume")),
+        c.get("source"),
+    )
+
+
+def _candle_arrays(candles: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """
+    Transpose a list of candle dicts into one list per column.
+
+    itemgetter/map/zip keep the per-row key lookups and the transpose in C;
+    rows missing an optional key fall back to the slower dict.get path.
+    """
+    try:
+        rows = list(map(_candle_row, candles))
+    except KeyError:
+        rows = [tuple(c.get(col) for col in CANDLE_COLUMNS) for c in candles]
+    return _candle_columns_to_arrays(dict(zip(CANDLE_COLUMNS, zip(*rows))))
+
+
+def _candle_columns_to_arrays(
+    cols: Mapping[str, Sequence[Any]],
+) -> dict[str, list[Any]]:
+    """
+    Normalize column-oriented candle data into bindable lists.
+
+    Price/volume values are coerced to float: the driver binds each list as
+    a single typed array and rejects mixed int/float/Decimal elements.
+    Missing optional columns (e.g. ``source``) are filled with NULLs.
+    """
+    n = len(cols["timestamp"])
+    arrays: dict[str, list[Any]] = {}
+    for col in CANDLE_COLUMNS:
+        values = cols.get(col)
+        if values is None:
+            arrays[col] = [None] * n
+        elif col in _CANDLE_PRICE_COLUMNS:
+            arrays[col] = [_as_float(v) for v in values]
+        else:
+            arrays[col] = list(values)
+        if len(arrays[col]) != n:
+            raise ValueError(
+                f"candle column {col!r} has {len(arrays[col])} values, expected {n}"
+            )
+    return arrays
+
 
 @dataclass
 class PortfolioState:
@@ -37,6 +240,65 @@ class PortfolioState:
     open_trades: list[Trade]
     last_snapshot: DailySnapshot | None
 
+    # Derived once per load so per-bar risk checks are plain int/float
+    # comparisons rather than len() calls and Decimal -> float conversions.
+    open_trades_count: int = field(init=False)
+    realized_pnl_float: float | None = field(init=False)
+    ending_equity_float: float | None = field(init=False)
+
+    # Sums over open trades with both an entry price and a size, so the
+    # unrealized P/L at any price is O(1):
+    #   sum((price - entry) * size) == price * open_size_float - open_cost_float
+    open_size_float: float = field(init=False)
+    open_cost_float: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.open_trades_count = len(self.open_trades)
+        self._sum_open_trades()
+        self.refresh_snapshot(self.last_snapshot)
+
+    def _sum_open_trades(self) -> None:
+        size_total = 0.0
+        cost_total = 0.0
+        for trade in self.open_trades:
+            if trade.entry_price is None or trade.size is None:
+                continue
+            size = float(trade.size)
+            size_total += size
+            cost_total += float(trade.entry_price) * size
+        self.open_size_float = size_total
+        self.open_cost_float = cost_total
+
+    def refresh_snapshot(self, snapshot: DailySnapshot | None) -> None:
+        """Swap in a new snapshot and re-derive its cached float values."""
+        self.last_snapshot = snapshot
+        if snapshot is None:
+            self.realized_pnl_float = None
+            self.ending_equity_float = None
+            return
+        self.realized_pnl_float = (
+            float(snapshot.realized_pnl)
+            if snapshot.realized_pnl is not None else None
+        )
+        self.ending_equity_float = (
+            float(snapshot.ending_equity)
+            if snapshot.ending_equity is not None else None
+        )
+
+    def trade_opened(self, trade: Trade) -> None:
+        self.open_trades.append(trade)
+        self.open_trades_count += 1
+        if trade.entry_price is not None and trade.size is not None:
+            size = float(trade.size)
+            self.open_size_float += size
+            self.open_cost_float += float(trade.entry_price) * size
+
+    def trade_closed(self, trade: Trade) -> None:
+        self.open_trades.remove(trade)
+        self.open_trades_count -= 1
+        # Re-summed rather than subtracted so rounding can't drift
+        self._sum_open_trades()
+
 # -------------------------------------------------------------------
 # DB Facade
 # -------------------------------------------------------------------
@@ -75,25 +337,35 @@ class DB:
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def _pipelined(self, session: AsyncSession):
+        """
+        Put the session's psycopg connection into pipeline mode.
+
+        Statements issued inside the block are sent without waiting for
+        each result, so bulk operations that issue several statements
+        (candle batches, stage + merge) overlap their round-trips.
+        """
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        async with raw.driver_connection.pipeline():
+            yield session
+
     # ---------------------------------------------------------------
     # Asset helpers
     # ---------------------------------------------------------------
 
     async def add_asset(self, symbol: str, base: str | None, quote: str | None) -> Asset:
-        async with async_session_maker() as session:
+        async with async_session_maker() as session, session.begin():
             asset = Asset(
                 symbol=symbol,
                 base_asset=base,
                 quote_asset=quote,
             )
-            try:
-                session.add(asset)
-                await session.commit()
-                await session.refresh(asset)
-                return asset
-            except:
-                await session.rollback()
-                raise
+            session.add(asset)
+            await session.flush()
+            await session.refresh(asset)
+            return asset
 
     async def get_asset_by_symbol(self, symbol: str) -> Asset | None:
         async with async_session_maker() as session:
@@ -109,7 +381,7 @@ class DB:
         quote: str | None = None,
     ) -> Asset:
 
-        async with async_session_maker() as session:
+        async with async_session_maker() as session, session.begin():
             result = await session.execute(
                 select(Asset).where(Asset.symbol == symbol)
             )
@@ -122,14 +394,10 @@ class DB:
                 base_asset=base,
                 quote_asset=quote,
             )
-            try:
-                session.add(asset)
-                await session.commit()
-                await session.refresh(asset)
-                return asset
-            except:
-                await session.rollback()
-                raise
+            session.add(asset)
+            await session.flush()
+            await session.refresh(asset)
+            return asset
 
     # ---------------------------------------------------------------
     # Portfolio helpers
@@ -142,21 +410,17 @@ class DB:
         base_currency: str,
         starting_equity: float | None = None,
     ) -> Portfolio:
-        async with async_session_maker() as session:
+        async with async_session_maker() as session, session.begin():
             portfolio = Portfolio(
                 name=name,
                 mode=mode,
                 base_currency=base_currency,
                 starting_equity=starting_equity,
             )
-            try:
-                session.add(portfolio)
-                await session.commit()
-                await session.refresh(portfolio)
-                return portfolio
-            except:
-                await session.rollback()
-                raise
+            session.add(portfolio)
+            await session.flush()
+            await session.refresh(portfolio)
+            return portfolio
 
     async def get_portfolio(self, portfolio_id: int) -> Portfolio | None:
         async with async_session_maker() as session:
@@ -179,49 +443,59 @@ class DB:
             )
             return result.scalars().first()
 
+    async def _fetch_all(self, stmt) -> list:
+        async with async_session_maker() as session:
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
+    async def _fetch_first(self, stmt):
+        async with async_session_maker() as session:
+            result = await session.execute(stmt)
+            return result.scalars().first()
+
     async def load_portfolio_state(
         self,
         portfolio_id: int,
     ) -> PortfolioState | None:
+        """
+        Load a portfolio with its open orders, open trades and latest snapshot.
 
-        async with async_session_maker() as session:
-            pf_result = await session.execute(
-                select(Portfolio).where(Portfolio.id == portfolio_id)
-            )
-            portfolio = pf_result.scalars().first()
-            if portfolio is None:
-                return None
+        The four selects are independent, so each runs on its own pooled
+        session concurrently; wall-clock cost is one round-trip, not four.
+        """
 
-            orders_result = await session.execute(
+        portfolio, open_orders, open_trades, last_snapshot = await asyncio.gather(
+            self._fetch_first(
+                select(Portfolio).where(Portfolio.id == portfolio_id)
+            ),
+            self._fetch_all(
                 select(Order).where(
                     Order.portfolio_id == portfolio_id,
                     Order.status.in_(OPEN_ORDER_STATUSES),
                 )
-            )
-            open_orders = list(orders_result.scalars().all())
-
-            trades_result = await session.execute(
+            ),
+            self._fetch_all(
                 select(Trade).where(
                     Trade.portfolio_id == portfolio_id,
                     Trade.closed_at.is_(None),
                 )
-            )
-            open_trades = list(trades_result.scalars().all())
-
-            snapshot_result = await session.execute(
+            ),
+            self._fetch_first(
                 select(DailySnapshot)
                 .where(DailySnapshot.portfolio_id == portfolio_id)
                 .order_by(DailySnapshot.date.desc())
                 .limit(1)
-            )
-            last_snapshot = snapshot_result.scalars().first()
-
-            return PortfolioState(
-                portfolio=portfolio,
-                open_orders=open_orders,
-                open_trades=open_trades,
-                last_snapshot=last_snapshot,
-            )
+            ),
+        )
+        if portfolio is None:
+            return None
+
+        return PortfolioState(
+            portfolio=portfolio,
+            open_orders=open_orders,
+            open_trades=open_trades,
+            last_snapshot=last_snapshot,
+        )
 
     # ---------------------------------------------------------------
     # Order helpers
@@ -265,6 +539,149 @@ class DB:
     # Utility inserts: signals, trades, snapshots, errors
     # ---------------------------------------------------------------
 
+    async def _insert_returning(self, model, values: dict[str, Any]):
+        """
+        Insert a single row with Core INSERT ... RETURNING.
+
+        Write-only paths never re-read the object, so this skips the
+        unit-of-work flush and the follow-up refresh SELECT; the row comes
+        back as a loaded ORM instance in the same round-trip.
+        """
+        async with async_session_maker() as session, session.begin():
+            return await session.scalar(
+                insert(model).values(**values).returning(model)
+            )
+
+    async def _insert_many_returning(self, model, rows: list[dict[str, Any]]) -> list:
+        """
+        Insert many rows in one executemany INSERT ... RETURNING.
+
+        Rows come back as ORM instances in the same order as ``rows``.
+        """
+        if not rows:
+            return []
+
+        async with async_session_maker() as session, session.begin():
+            result = await session.scalars(
+                insert(model).returning(model, sort_by_parameter_order=True),
+                rows,
+            )
+            return list(result.all())
+
+    async def record_signals_bulk(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> list[Signal]:
+        """
+        Insert many signals in one round-trip.
+
+        Each row takes the same keyword arguments as ``record_signal``.
+        Rows without a timestamp are stamped with a single batch time.
+        """
+        now = None
+        values = []
+        for row in rows:
+            ts = row.get("timestamp")
+            if ts is None:
+                if now is None:
+                    now = datetime.now(_UTC)
+                ts = now
+            values.append(
+                {
+                    "portfolio_id": row["portfolio_id"],
+                    "asset_id": row["asset_id"],
+                    "strategy_config_id": row.get("strategy_config_id"),
+                    "timestamp": _as_utc(ts),
+                    "signal_type": row["signal_type"],
+                    "price": row.get("price"),
+                    "extra": row.get("extra"),
+                }
+            )
+        return await self._insert_many_returning(Signal, values)
+
+    async def insert_signals(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """
+        Fire-and-forget signal insert: one Core executemany, no RETURNING.
+
+        For buffered writers that never read the rows back by PK; skips the
+        ORM identity map entirely. Rows take ``record_signal`` kwargs.
+        """
+        if not rows:
+            return
+
+        now = datetime.now(_UTC)
+        params = [
+            {
+                "portfolio_id": row["portfolio_id"],
+                "asset_id": row["asset_id"],
+                "strategy_config_id": row.get("strategy_config_id"),
+                "timestamp": _as_utc(row.get("timestamp")) or now,
+                "signal_type": row["signal_type"],
+                "price": row.get("price"),
+                # Core table key is the column name, not the ORM attribute.
+                "metadata": row.get("extra"),
+            }
+            for row in rows
+        ]
+
+        async with async_session_maker() as session, session.begin():
+            await session.execute(insert(Signal.__table__), params)
+
+    async def record_trades_bulk(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> list[Trade]:
+        """Insert many trades in one round-trip (``record_trade`` kwargs per row)."""
+        values = []
+        for row in rows:
+            closed_at = row.get("closed_at")
+            values.append(
+                {
+                    "portfolio_id": row["portfolio_id"],
+                    "asset_id": row["asset_id"],
+                    "strategy_config_id": row.get("strategy_config_id"),
+                    "entry_order_id": row["entry_order_id"],
+                    "exit_order_id": row.get("exit_order_id"),
+                    "entry_price": row.get("entry_price"),
+                    "exit_price": row.get("exit_price"),
+                    "size": row.get("size"),
+                    "realized_pnl": row.get("realized_pnl"),
+                    "realized_pnl_pct": row.get("realized_pnl_pct"),
+                    "opened_at": self._normalize_dt(row.get("opened_at")),
+                    "closed_at": self._normalize_dt(closed_at) if closed_at else None,
+                    "exit_reason": row.get("exit_reason"),
+                }
+            )
+        return await self._insert_many_returning(Trade, values)
+
+    async def record_snapshots_bulk(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> list[DailySnapshot]:
+        """Insert many daily snapshots in one round-trip (``record_snapshot`` kwargs per row)."""
+        values = []
+        for row in rows:
+            values.append(
+                {
+                    "portfolio_id": row["portfolio_id"],
+                    "date": row["date_"],
+                    "starting_equity": row.get("starting_equity"),
+                    "ending_equity": row.get("ending_equity"),
+                    "realized_pnl": row.get("realized_pnl"),
+                    "unrealized_pnl": row.get("unrealized_pnl"),
+                    "deposits_withdrawals": row.get("deposits_withdrawals"),
+                    "num_trades": row.get("num_trades"),
+                    "num_winning_trades": row.get("num_winning_trades"),
+                    "num_losing_trades": row.get("num_losing_trades"),
+                    "max_intraday_drawdown": row.get("max_intraday_drawdown"),
+                    "day_label": row.get("day_label"),
+                }
+            )
+        return await self._insert_many_returning(DailySnapshot, values)
+
     async def record_signal(
         self,
         portfolio_id: int,
@@ -276,27 +693,19 @@ class DB:
         timestamp: datetime | None = None,
     ) -> Signal:
 
-        timestamp = self._normalize_dt(timestamp)
+        values = {
+            "portfolio_id": portfolio_id,
+            "asset_id": asset_id,
+            "strategy_config_id": strategy_config_id,
+            "signal_type": signal_type,
+            "price": price,
+            "extra": extra,
+        }
+        # When omitted, the column's server default (now()) applies.
+        if timestamp is not None:
+            values["timestamp"] = _as_utc(timestamp)
 
-        async with async_session_maker() as session:
-            signal = Signal(
-                portfolio_id=portfolio_id,
-                asset_id=asset_id,
-                strategy_config_id=strategy_config_id,
-                timestamp=timestamp,
-                signal_type=signal_type,
-                price=price,
-                extra=extra,
-            )
-            try:
-                session.add(signal)
-                await session.commit()
-            except:
-                await session.rollback()
-                raise
-
-            await session.refresh(signal)
-            return signal
+        return await self._insert_returning(Signal, values)
 
     async def record_trade(
         self,
@@ -315,34 +724,26 @@ class DB:
         exit_reason: str | None = None,
     ) -> Trade:
 
-        opened_at = self._normalize_dt(opened_at)
-        closed_at = self._normalize_dt(closed_at) if closed_at else None
-
-        async with async_session_maker() as session:
-            trade = Trade(
-                portfolio_id=portfolio_id,
-                asset_id=asset_id,
-                strategy_config_id=strategy_config_id,
-                entry_order_id=entry_order_id,
-                exit_order_id=exit_order_id,
-                entry_price=entry_price,
-                exit_price=exit_price,
-                size=size,
-                realized_pnl=realized_pnl,
-                realized_pnl_pct=realized_pnl_pct,
-                opened_at=opened_at,
-                closed_at=closed_at,
-                exit_reason=exit_reason,
-            )
-            try:
-                session.add(trade)
-                await session.commit()
-            except:
-                await session.rollback()
-                raise
-
-            await session.refresh(trade)
-            return trade
+        trades = await self.record_trades_bulk(
+            [
+                {
+                    "portfolio_id": portfolio_id,
+                    "asset_id": asset_id,
+                    "strategy_config_id": strategy_config_id,
+                    "entry_order_id": entry_order_id,
+                    "exit_order_id": exit_order_id,
+                    "entry_price": entry_price,
+                    "exit_price": exit_price,
+                    "size": size,
+                    "realized_pnl": realized_pnl,
+                    "realized_pnl_pct": realized_pnl_pct,
+                    "opened_at": opened_at,
+                    "closed_at": closed_at,
+                    "exit_reason": exit_reason,
+                }
+            ]
+        )
+        return trades[0]
 
     async def record_snapshot(
         self,
@@ -360,29 +761,43 @@ class DB:
         day_label: str | None = None,
     ) -> DailySnapshot:
 
-        async with async_session_maker() as session:
-            snapshot = DailySnapshot(
-                portfolio_id=portfolio_id,
-                date=date_,
-                starting_equity=starting_equity,
-                ending_equity=ending_equity,
-                realized_pnl=realized_pnl,
-                unrealized_pnl=unrealized_pnl,
-                deposits_withdrawals=deposits_withdrawals,
-                num_trades=num_trades,
-                num_winning_trades=num_winning_trades,
-                num_losing_trades=num_losing_trades,
-                max_intraday_drawdown=max_intraday_drawdown,
-                day_label=day_label,
-            )
-            try:
-                session.add(snapshot)
-                await session.commit()
-                await session.refresh(snapshot)
-                return snapshot
-            except:
-                await session.rollback()
-                raise
+        snapshots = await self.record_snapshots_bulk(
+            [
+                {
+                    "portfolio_id": portfolio_id,
+                    "date_": date_,
+                    "starting_equity": starting_equity,
+                    "ending_equity": ending_equity,
+                    "realized_pnl": realized_pnl,
+                    "unrealized_pnl": unrealized_pnl,
+                    "deposits_withdrawals": deposits_withdrawals,
+                    "num_trades": num_trades,
+                    "num_winning_trades": num_winning_trades,
+                    "num_losing_trades": num_losing_trades,
+                    "max_intraday_drawdown": max_intraday_drawdown,
+                    "day_label": day_label,
+                }
+            ]
+        )
+        return snapshots[0]
+
+    async def record_risk_event(
+        self,
+        portfolio_id: int,
+        event_type: str,
+        details: dict[str, Any] | None = None,
+        triggered_at: datetime | None = None,
+    ) -> RiskEvent:
+
+        values = {
+            "portfolio_id": portfolio_id,
+            "event_type": event_type,
+            "details": details,
+        }
+        if triggered_at is not None:
+            values["triggered_at"] = _as_utc(triggered_at)
+
+        return await self._insert_returning(RiskEvent, values)
 
     async def record_error(
         self,
@@ -392,29 +807,55 @@ class DB:
         occurred_at: datetime | None = None,
     ) -> ErrorLog:
 
-        occurred_at = self._normalize_dt(occurred_at)
+        values = {
+            "context": context,
+            "message": message,
+            "stacktrace": stacktrace,
+        }
+        if occurred_at is not None:
+            values["occurred_at"] = _as_utc(occurred_at)
 
-        async with async_session_maker() as session:
-            err = ErrorLog(
-                context=context,
-                message=message,
-                stacktrace=stacktrace,
-                occurred_at=occurred_at,
-            )
-            try:
-                session.add(err)
-                await session.commit()
-            except:
-                await session.rollback()
-                raise
-
-            await session.refresh(err)
-            return err
+        return await self._insert_returning(ErrorLog, values)
 
     # ---------------------------------------------------------------
     # Bulk operations: candles
     # ---------------------------------------------------------------
 
+    async def load_recent_candles(
+        self,
+        asset_id: int,
+        timeframe: str,
+        limit: int,
+    ) -> list:
+        """
+        Return the latest ``limit`` candles for an asset/timeframe, oldest
+        first, e.g. to warm up a strategy's rolling windows.
+
+        Only the columns held in ix_candles_aitf_ts_desc are selected so the
+        read is an index-only scan; rows expose ``timestamp``/``open``/
+        ``high``/``low``/``close``/``volume`` as attributes like a Candle.
+        """
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(
+                    Candle.timestamp,
+                    Candle.open,
+                    Candle.high,
+                    Candle.low,
+                    Candle.close,
+                    Candle.volume,
+                )
+                .where(
+                    Candle.asset_id == asset_id,
+                    Candle.timeframe == timeframe,
+                )
+                .order_by(Candle.timestamp.desc())
+                .limit(limit)
+            )
+            rows = list(result.all())
+            rows.reverse()
+            return rows
+
     async def insert_candles(
         self,
         candles: Iterable[dict[str, Any]],
@@ -424,10 +865,9 @@ class DB:
         if not candles:
             return
 
-        async with async_session_maker() as session:
-            stmt = pg_insert(Candle).values(candles)
-            await session.execute(stmt)
-            await session.commit()
+        await self._execute_candle_arrays(
+            _INSERT_CANDLES_STMT, _candle_arrays(candles)
+        )
 
     async def upsert_candles(
         self,
@@ -438,26 +878,100 @@ class DB:
         if not candles:
             return
 
-        async with async_session_maker() as session:
-            stmt = pg_insert(Candle).values(candles)
-
-            update_cols = {
-                "open": stmt.excluded.open,
-                "high": stmt.excluded.high,
-                "low": stmt.excluded.low,
-                "close": stmt.excluded.close,
-                "volume": stmt.excluded.volume,
-                "source": stmt.excluded.source,
-            }
+        await self._execute_candle_arrays(
+            _UPSERT_CANDLES_STMT, _candle_arrays(candles)
+        )
 
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[
-                    Candle.asset_id,
-                    Candle.timeframe,
-                    Candle.timestamp,
-                ],
-                set_=update_cols,
-            )
+    async def insert_candles_soa(
+        self,
+        cols: Mapping[str, Sequence[Any]],
+    ) -> None:
+        """
+        Insert candles given column-oriented data, e.g.
+        ``{"asset_id": [...], "timeframe": [...], "timestamp": [...], ...}``.
+
+        Skips building one dict per row. Callers holding a DataFrame should
+        pass ``df.to_dict("list")`` rather than ``df.to_dict("records")``.
+        """
+        if not cols or not len(cols.get("timestamp", ())):
+            return
+
+        await self._execute_candle_arrays(
+            _INSERT_CANDLES_STMT, _candle_columns_to_arrays(cols)
+        )
+
+    async def upsert_candles_soa(
+        self,
+        cols: Mapping[str, Sequence[Any]],
+    ) -> None:
+        """Column-oriented variant of ``upsert_candles``."""
+        if not cols or not len(cols.get("timestamp", ())):
+            return
+
+        await self._execute_candle_arrays(
+            _UPSERT_CANDLES_STMT, _candle_columns_to_arrays(cols)
+        )
+
+    async def bulk_insert_candles(
+        self,
+        candles: Iterable[dict[str, Any]],
+        batch_size: int = CANDLE_BATCH_SIZE,
+    ) -> None:
+        """
+        Insert a large candle backfill, skipping rows that already exist.
+
+        Rows are sent in chunks of ``batch_size``; every chunk is queued on
+        the same pipelined connection inside one transaction, so the whole
+        backfill costs roughly one round-trip plus the commit.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
 
-            await session.execute(stmt)
-            await session.commit()
+        candles = list(candles)
+        if not candles:
+            return
+
+        async with async_session_maker() as session, session.begin():
+            async with self._pipelined(session):
+                for start in range(0, len(candles), batch_size):
+                    chunk = candles[start:start + batch_size]
+                    await session.execute(
+                        _INSERT_CANDLES_SKIP_STMT, _candle_arrays(chunk)
+                    )
+
+    async def copy_candles(
+        self,
+        candles: Iterable[dict[str, Any]],
+    ) -> int:
+        """
+        Stream a historical backfill in with COPY, skipping existing rows.
+
+        Rows are consumed lazily from ``candles`` and written with binary
+        COPY into a temporary staging table, then merged into ``candles``
+        with ON CONFLICT DO NOTHING in one statement. Memory stays bounded
+        by the iterator, not the backfill size.
+
+        Returns the number of rows actually inserted.
+        """
+        async with async_session_maker() as session, session.begin():
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            pg = raw.driver_connection
+
+            async with pg.cursor() as cur:
+                await cur.execute(_CANDLE_STAGE_DDL)
+                async with cur.copy(_CANDLE_STAGE_COPY) as copy:
+                    copy.set_types(_CANDLE_STAGE_COPY_TYPES)
+                    for c in candles:
+                        await copy.write_row(_candle_copy_row(c))
+                await cur.execute(_CANDLE_STAGE_MERGE)
+                return cur.rowcount
+
+    async def _execute_candle_arrays(
+        self,
+        stmt,
+        arrays: dict[str, list[Any]],
+    ) -> None:
+        async with async_session_maker() as session, session.begin():
+            async with self._pipelined(session):
+                await session.execute(stmt, arrays)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import json
 import os
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
@@ -10,10 +11,49 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if DATABASE_URL is None:
     raise RuntimeError("DATABASE_URL is not set in environment variables.")
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+# Signal metadata is serialized on every write; use orjson when installed.
+if orjson is not None:
+    def _json_serializer(value) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_deserializer = orjson.loads
+else:
+    def _json_serializer(value) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+    _json_deserializer = json.loads
+
+
 engine = create_async_engine(
     DATABASE_URL,
-    echo=False,          
+    echo=False,
     future=True,
+    # Candle backfills and signal bursts open many short sessions at once.
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200,
+    # Batched ORM/Core inserts (bulk signals, trades, snapshots) are sent as
+    # multi-row INSERT ... VALUES ... RETURNING pages rather than one
+    # statement per row. This is SQLAlchemy 2's default, with its default
+    # page size; stated so a driver switch doesn't silently lose it.
+    use_insertmanyvalues=True,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+    connect_args={
+        # JIT only adds planning time to our short OLTP / bulk-insert statements.
+        "options": "-c jit=off",
+        "application_name": "trading-bot",
+        # psycopg server-side prepares a statement after this many executions.
+        "prepare_threshold": 2,
+    },
 )
 
 async_session_maker = async_sessionmaker(
@@ -12,11 +12,15 @@ from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Float,
     Integer,
     Numeric,
     String,
     Text,
+    desc,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -25,6 +29,11 @@ from sqlalchemy.orm import (
 )
 
 
+# JSON payloads written per bar (signal metadata, risk details) are stored
+# as JSONB on Postgres: binary on disk and cheaper to query.
+JSONPayload = JSON().with_variant(JSONB(), "postgresql")
+
+
 # ============================================================
 # Base Declarative Class
 # ============================================================
@@ -169,6 +178,18 @@ class Order(Base):
         uselist=False,
     )
 
+    __table_args__ = (
+        # Partial index: only open orders are looked up on the hot path.
+        Index(
+            "ix_orders_open_lookup",
+            "portfolio_id",
+            "asset_id",
+            postgresql_where=text(
+                "status IN ('open', 'pending', 'partially_filled')"
+            ),
+        ),
+    )
+
 
 # ============================================================
 # Trades
@@ -220,6 +241,14 @@ class Trade(Base):
         foreign_keys=[exit_order_id],
     )
 
+    __table_args__ = (
+        Index(
+            "ix_trades_open",
+            "portfolio_id",
+            postgresql_where=text("closed_at IS NULL"),
+        ),
+    )
+
 
 # ============================================================
 # Daily Snapshots
@@ -253,6 +282,7 @@ class DailySnapshot(Base):
 
     __table_args__ = (
         UniqueConstraint("portfolio_id", "date"),
+        Index("ix_snapshots_pf_date_desc", "portfolio_id", desc("date")),
     )
 
 
@@ -338,16 +368,20 @@ class BacktestRun(Base):
 class Candle(Base):
     __tablename__ = "candles"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    # Partitioned by timeframe (see __table_args__): the partition key has to
+    # be part of every unique constraint, including the primary key.
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id"))
-    timeframe: Mapped[str] = mapped_column(String)
+    timeframe: Mapped[str] = mapped_column(String, primary_key=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True))
 
-    open: Mapped[Optional[float]] = mapped_column(Numeric(18, 8))
-    high: Mapped[Optional[float]] = mapped_column(Numeric(18, 8))
-    low: Mapped[Optional[float]] = mapped_column(Numeric(18, 8))
-    close: Mapped[Optional[float]] = mapped_column(Numeric(18, 8))
-    volume: Mapped[Optional[float]] = mapped_column(Numeric(28, 8))
+    # Market data is stored as double precision: candles are written in bulk
+    # and read back into float math, so numeric/Decimal buys nothing here.
+    open: Mapped[Optional[float]] = mapped_column(Float)
+    high: Mapped[Optional[float]] = mapped_column(Float)
+    low: Mapped[Optional[float]] = mapped_column(Float)
+    close: Mapped[Optional[float]] = mapped_column(Float)
+    volume: Mapped[Optional[float]] = mapped_column(Float)
 
     source: Mapped[Optional[str]] = mapped_column(String)
     created_at: Mapped[datetime] = mapped_column(
@@ -358,6 +392,22 @@ class Candle(Base):
 
     __table_args__ = (
         UniqueConstraint("asset_id", "timeframe", "timestamp"),
+        # Covering index for "last N candles" warm-up reads (index-only scan).
+        Index(
+            "ix_candles_aitf_ts_desc",
+            "asset_id",
+            "timeframe",
+            desc("timestamp"),
+            postgresql_include=["open", "high", "low", "close", "volume"],
+        ),
+        # Candles arrive in time order, so a BRIN index prunes range scans
+        # for a fraction of a B-tree's size.
+        Index(
+            "ix_candles_ts_brin",
+            "timestamp",
+            postgresql_using="brin",
+        ),
+        {"postgresql_partition_by": "LIST (timeframe)"},
     )
 
 
@@ -375,12 +425,14 @@ class Signal(Base):
         ForeignKey("strategy_configs.id")
     )
 
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
     signal_type: Mapped[str] = mapped_column(String, nullable=False)  # enter | exit | hold
-    price: Mapped[Optional[float]] = mapped_column(Numeric(18, 8))
+    price: Mapped[Optional[float]] = mapped_column(Float)
     extra: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         "metadata",  # column name
-        JSON
+        JSONPayload
     )
 
     created_at: Mapped[datetime] = mapped_column(
@@ -405,15 +457,27 @@ class RiskEvent(Base):
     portfolio_id: Mapped[int] = mapped_column(ForeignKey("portfolios.id"))
 
     event_type: Mapped[str] = mapped_column(String, nullable=False)
-    details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
+    details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONPayload)
 
-    triggered_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    triggered_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
 
     portfolio: Mapped["Portfolio"] = relationship(back_populates="risk_events")
 
+    __table_args__ = (
+        # Append-only, time-ordered: BRIN is tiny and fits range lookups.
+        Index(
+            "ix_risk_events_triggered_brin",
+            "triggered_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
 
 # ============================================================
 # Errors
@@ -427,7 +491,18 @@ class ErrorLog(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     stacktrace: Mapped[Optional[str]] = mapped_column(Text)
 
-    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+
+    __table_args__ = (
+        Index(
+            "ix_errors_occurred_brin",
+            "occurred_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Table, insert
+
+from bot.core.logger import get_logger
+from .db import _UTC, _as_utc
+from .engine import async_session_maker
+from .models import RiskEvent, Signal
+
+logger = get_logger(__name__)
+
+
+class BulkWriter:
+    """
+    Group-commit writer for high-volume, non-critical rows.
+
+    Producers push rows onto an in-memory queue without awaiting the
+    database. A background task drains the queue and writes everything
+    collected in one transaction (one executemany per table) whenever
+    `max_batch` rows are pending or `flush_interval` seconds have passed
+    since the first pending row, whichever comes first.
+
+    Trade-off: rows still queued when the process dies are lost (at most
+    ~flush_interval worth). Use it for signals and risk events; keep the
+    trade ledger and backtest runs on the synchronous DB methods.
+
+    Usage:
+        writer = BulkWriter()
+        await writer.start()
+        writer.submit_signal(...)
+        ...
+        await writer.stop()   # drains anything still queued
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.1,
+        max_batch: int = 500,
+    ):
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._queue: asyncio.Queue[tuple[Table, dict[str, Any]] | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    # ---------------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------------
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush everything queued so far and stop the background task."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    # ---------------------------------------------------------------
+    # Producers
+    # ---------------------------------------------------------------
+
+    def submit(self, table: Table, row: dict[str, Any]) -> None:
+        """Queue a row keyed by the table's column names."""
+        self._queue.put_nowait((table, row))
+
+    def submit_signal(
+        self,
+        portfolio_id: int,
+        asset_id: int,
+        strategy_config_id: int | None,
+        signal_type: str,
+        price: float | None,
+        extra: dict[str, Any] | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        # Stamp at submit time, not flush time; every row in an
+        # executemany batch must also carry the same keys.
+        self.submit(
+            Signal.__table__,
+            {
+                "portfolio_id": portfolio_id,
+                "asset_id": asset_id,
+                "strategy_config_id": strategy_config_id,
+                "timestamp": _as_utc(timestamp) or datetime.now(_UTC),
+                "signal_type": signal_type,
+                "price": price,
+                "metadata": extra,
+            },
+        )
+
+    def submit_risk_event(
+        self,
+        portfolio_id: int,
+        event_type: str,
+        details: dict[str, Any] | None = None,
+        triggered_at: datetime | None = None,
+    ) -> None:
+        self.submit(
+            RiskEvent.__table__,
+            {
+                "portfolio_id": portfolio_id,
+                "event_type": event_type,
+                "details": details,
+                "triggered_at": _as_utc(triggered_at) or datetime.now(_UTC),
+            },
+        )
+
+    # ---------------------------------------------------------------
+    # Background flusher
+    # ---------------------------------------------------------------
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            pending: dict[Table, list[dict[str, Any]]] = defaultdict(list)
+            table, row = item
+            pending[table].append(row)
+            count = 1
+            deadline = loop.time() + self.flush_interval
+
+            while count < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                table, row = item
+                pending[table].append(row)
+                count += 1
+
+            await self._flush(pending)
+
+    async def _flush(self, pending: dict[Table, list[dict[str, Any]]]) -> None:
+        try:
+            async with async_session_maker() as session, session.begin():
+                for table, rows in pending.items():
+                    await session.execute(insert(table), rows)
+        except Exception:
+            dropped = sum(len(rows) for rows in pending.values())
+            logger.exception("BulkWriter flush failed; dropped %d rows", dropped)
@@ -0,0 +1,52 @@
+# bot/strategies/_sweep.py
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Close series for the current worker process, set once by the initializer
+_worker_closes: list[float] = []
+
+
+def _init_worker(closes: list[float]) -> None:
+    # Each worker receives the close series once, not once per task.
+    global _worker_closes
+    _worker_closes = closes
+
+
+def _run_task(kernel: Callable[[list[float], T], R], task: T) -> R:
+    return kernel(_worker_closes, task)
+
+
+def run_sweep(
+    kernel: Callable[[list[float], T], R],
+    closes: Iterable[Any],
+    tasks: Iterable[T],
+    max_workers: int | None = None,
+) -> list[R]:
+    """
+    Evaluate kernel(closes, task) for every task across worker processes.
+
+    `closes` is converted to floats once and shipped to each worker once;
+    `kernel` must be a module-level function so it pickles by reference.
+    Results come back in task order.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+
+    series = [float(c) for c in closes]
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(series,),
+    ) as pool:
+        return list(pool.map(partial(_run_task, kernel), tasks, chunksize=chunksize))
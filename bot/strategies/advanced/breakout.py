@@ -2,17 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 from collections import deque
 from typing import Optional
 
 from bot.strategies.base import Strategy
 from bot.strategies.signals import StrategySignal, SignalType
+from bot.strategies.indicators.ringbuffer import RingBuffer
 from bot.strategies.indicators.volatility import atr
-from bot.strategies.portfolio_metrics import (
-    compute_unrealized_pnl,
-    compute_last_trade_info,
-    compute_drawdown_status,
-)
+from bot.strategies.portfolio_metrics import PortfolioMetricsSnapshot
 from bot.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -51,24 +49,60 @@ class BreakoutStrategy(Strategy):
 
         max_history = int(self.params.get("max_history", self.lookback * 4))
 
-        self.highs = deque(maxlen=max_history)
-        self.lows = deque(maxlen=max_history)
-        self.closes = deque(maxlen=max_history)
+        self.highs = RingBuffer(max_history)
+        self.lows = RingBuffer(max_history)
+        self.closes = RingBuffer(max_history)
 
         self.atr_val: Optional[float] = None
 
+        # Checked once; call refresh_log_level() after reconfiguring logging.
+        self.refresh_log_level()
+
+        # Monotonic sliding windows over the last `lookback` bars:
+        # (bar_index, value) pairs, highs decreasing / lows increasing,
+        # so the window max/min is always at the front.
+        self._i = 0
+        self._hh_idx: deque = deque()
+        self._ll_idx: deque = deque()
+
         if self.lookback <= 0:
             raise ValueError("lookback must be positive")
 
+    def refresh_log_level(self) -> None:
+        self._log_info_enabled = logger.isEnabledFor(logging.INFO)
+
     # ----------------------------------------------------------------------
     # Indicator Updates
     # ----------------------------------------------------------------------
 
     def _update_indicators(self, candle):
-        self.highs.append(float(candle.high))
-        self.lows.append(float(candle.low))
+        if not self._is_new_bar(candle):
+            return
+
+        high = float(candle.high)
+        low = float(candle.low)
+
+        self.highs.append(high)
+        self.lows.append(low)
         self.closes.append(float(candle.close))
 
+        i = self._i
+        hh = self._hh_idx
+        while hh and hh[-1][1] <= high:
+            hh.pop()
+        hh.append((i, high))
+        ll = self._ll_idx
+        while ll and ll[-1][1] >= low:
+            ll.pop()
+        ll.append((i, low))
+
+        expired = i - self.lookback
+        while hh[0][0] <= expired:
+            hh.popleft()
+        while ll[0][0] <= expired:
+            ll.popleft()
+        self._i = i + 1
+
         self.atr_val = atr(
             self.highs,
             self.lows,
@@ -85,24 +119,20 @@ class BreakoutStrategy(Strategy):
     # ----------------------------------------------------------------------
 
     def _highest_high(self):
-        arr = list(self.highs)
-        if len(arr) < self.lookback:
+        if len(self.highs) < self.lookback:
             return None
-        return max(arr[-self.lookback:])  
-
+        return self._hh_idx[0][1]
 
     def _lowest_low(self):
-        arr = list(self.lows)
-        if len(arr) < self.lookback:
+        if len(self.lows) < self.lookback:
             return None
-        return min(arr[-self.lookback:]) 
+        return self._ll_idx[0][1]
 
-    def _breakout_up(self):
+    def _breakout_up(self, level):
         if not self._has_enough_data():
             return False
 
         close = self.closes[-1]
-        level = self._highest_high()
 
         buffer = 0.0
         if self.use_atr and self.atr_val:
@@ -112,12 +142,11 @@ class BreakoutStrategy(Strategy):
 
         return close > (level + buffer)
 
-    def _breakout_down(self):
+    def _breakout_down(self, level):
         if not self._has_enough_data():
             return False
 
         close = self.closes[-1]
-        level = self._lowest_low()
 
         buffer = 0.0
         if self.use_atr and self.atr_val:
@@ -134,91 +163,170 @@ class BreakoutStrategy(Strategy):
     def should_enter(self, candle, portfolio_state):
         self._update_indicators(candle)
 
-        if self._breakout_up():
-            logger.info(
-                "[BREAKOUT] ENTER breakout_up level=%.2f close=%.2f",
-                self._highest_high(),
-                self.closes[-1],
-            )
+        highest = self._highest_high()
+        if self._breakout_up(highest):
+            if self._log_info_enabled:
+                logger.info(
+                    "[BREAKOUT] ENTER breakout_up level=%.2f close=%.2f",
+                    highest,
+                    self.closes[-1],
+                )
             return True
 
         return False
 
     def should_exit(self, candle, portfolio_state):
-        if len(self.closes) == 0:
-            self._update_indicators(candle)
-            return False
-
         self._update_indicators(candle)
 
-        if self._breakout_down():
-            logger.info(
-                "[BREAKOUT] EXIT breakout_down level=%.2f close=%.2f",
-                self._lowest_low(),
-                self.closes[-1],
-            )
+        lowest = self._lowest_low()
+        if self._breakout_down(lowest):
+            if self._log_info_enabled:
+                logger.info(
+                    "[BREAKOUT] EXIT breakout_down level=%.2f close=%.2f",
+                    lowest,
+                    self.closes[-1],
+                )
             return True
 
         return False
 
+    # ----------------------------------------------------------------------
+    # Batch (backtest) evaluation
+    # ----------------------------------------------------------------------
+
+    def run_batch(self, highs, lows, closes) -> list[str]:
+        """
+        Breakout signals over parallel high / low / close histories, in one
+        pass with the same monotonic windows and ATR seeding as the live
+        path (run_batch contract: see Strategy).
+        """
+        n = len(closes)
+        if len(highs) != n or len(lows) != n:
+            raise ValueError("highs, lows and closes must have equal length")
+
+        lookback = self.lookback
+        use_atr = self.use_atr
+        atr_period = self.atr_period
+        atr_mult = self.atr_mult
+        buffer_pct = self.buffer_pct
+        max_history = self.closes.maxlen
+        atr_ready_at = atr_period if max_history >= atr_period + 1 else n
+
+        ENTER, EXIT, HOLD = SignalType.ENTER, SignalType.EXIT, SignalType.HOLD
+        out = [HOLD] * n
+
+        hh: deque = deque()
+        ll: deque = deque()
+        atr_val = None
+
+        for i in range(n):
+            high = highs[i]
+            low = lows[i]
+            close = closes[i]
+
+            while hh and hh[-1][1] <= high:
+                hh.pop()
+            hh.append((i, high))
+            while ll and ll[-1][1] >= low:
+                ll.pop()
+            ll.append((i, low))
+            expired = i - lookback
+            while hh[0][0] <= expired:
+                hh.popleft()
+            while ll[0][0] <= expired:
+                ll.popleft()
+
+            # ATR: bootstrap from bars 0..atr_period, then Wilder updates
+            if atr_val is not None:
+                prev_close = closes[i - 1]
+                tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+                atr_val = (atr_val * (atr_period - 1) + tr) / atr_period
+            elif i == atr_ready_at:
+                total = 0.0
+                for k in range(1, atr_period + 1):
+                    total += max(
+                        highs[k] - lows[k],
+                        abs(highs[k] - closes[k - 1]),
+                        abs(lows[k] - closes[k - 1]),
+                    )
+                atr_val = total / atr_period
+
+            if min(i + 1, max_history) < lookback:
+                continue
+
+            up_level = hh[0][1]
+            down_level = ll[0][1]
+            if use_atr and atr_val:
+                up_buf = down_buf = atr_val * atr_mult
+            elif buffer_pct:
+                up_buf = up_level * buffer_pct
+                down_buf = down_level * buffer_pct
+            else:
+                up_buf = down_buf = 0.0
+
+            if close > up_level + up_buf:
+                out[i] = ENTER
+            elif close < down_level - down_buf:
+                out[i] = EXIT
+
+        return out
+
     # ----------------------------------------------------------------------
     # Enriched Metadata
     # ----------------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state):
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: PortfolioMetricsSnapshot | None = None,
+    ):
         sig = super().generate_signal(candle, portfolio_state)
 
-        if sig.metadata is None:
-            sig.metadata = {}
+        signal_type = sig.signal_type
+        if signal_type == SignalType.ENTER:
+            reason = "breakout_up"
+        elif signal_type == SignalType.EXIT:
+            reason = "breakout_down"
+        elif not self.emit_hold_metadata:
+            return sig
+        else:
+            reason = (sig.metadata or {}).get("reason", "breakout_hold")
 
         price = float(candle.close)
 
         # ---- Portfolio Metrics ----
-        unrealized = compute_unrealized_pnl(portfolio_state, price)
-        last_entry_price, opened_at, sec_since = compute_last_trade_info(
-            portfolio_state
-        )
-        dd_state = compute_drawdown_status(
-            portfolio_state,
-            unrealized_pnl=unrealized,
-        )
+        if pm is None:
+            pm = PortfolioMetricsSnapshot.compute(portfolio_state, price)
+        dd_state = pm.drawdown
 
         # ---- Indicator Context ----
-        highest = self._highest_high() if self._has_enough_data() else None
-        lowest = self._lowest_low() if self._has_enough_data() else None
-
-        sig.metadata.update(
-            {
-                "strategy": "breakout",
-                "lookback": self.lookback,
-                "highest_high": highest,
-                "lowest_low": lowest,
-                "atr": self.atr_val,
-                "atr_period": self.atr_period,
-                "atr_mult": self.atr_mult,
-                "buffer_pct": self.buffer_pct,
-                # Portfolio + Risk
-                "unrealized_pnl": unrealized,
-                "last_entry_price": last_entry_price,
-                "last_trade_opened_at": opened_at.isoformat() if opened_at else None,
-                "time_since_last_trade_seconds": sec_since,
-                # Drawdown
-                "current_equity_est": dd_state["current_equity"],
-                "estimated_peak_equity": dd_state["estimated_peak_equity"],
-                "drawdown_abs": dd_state["drawdown_abs"],
-                "drawdown_pct": dd_state["drawdown_pct"],
-                "max_intraday_drawdown": dd_state["max_intraday_drawdown"],
-                # Last Close
-                "close": price,
-            }
-        )
-
-        # ---- Reasoning ----
-        if sig.signal_type == SignalType.ENTER:
-            sig.metadata["reason"] = "breakout_up"
-        elif sig.signal_type == SignalType.EXIT:
-            sig.metadata["reason"] = "breakout_down"
-        else:
-            sig.metadata.setdefault("reason", "breakout_hold")
+        highest = self._highest_high()
+        lowest = self._lowest_low()
+
+        sig.metadata = {
+            "reason": reason,
+            "strategy": "breakout",
+            "lookback": self.lookback,
+            "highest_high": highest,
+            "lowest_low": lowest,
+            "atr": self.atr_val,
+            "atr_period": self.atr_period,
+            "atr_mult": self.atr_mult,
+            "buffer_pct": self.buffer_pct,
+            # Portfolio + Risk
+            "unrealized_pnl": pm.unrealized_pnl,
+            "last_entry_price": pm.last_entry_price,
+            "last_trade_opened_at_ts": pm.last_trade_opened_at_ts,
+            "time_since_last_trade_seconds": pm.seconds_since_last_trade,
+            # Drawdown
+            "current_equity_est": dd_state["current_equity"],
+            "estimated_peak_equity": dd_state["estimated_peak_equity"],
+            "drawdown_abs": dd_state["drawdown_abs"],
+            "drawdown_pct": dd_state["drawdown_pct"],
+            "max_intraday_drawdown": dd_state["max_intraday_drawdown"],
+            # Last Close
+            "close": price,
+        }
 
         return sig
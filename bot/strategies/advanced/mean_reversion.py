@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Optional
 
 from bot.strategies.base import Strategy
 from bot.strategies.signals import StrategySignal, SignalType
-from bot.strategies.indicators.moving_averages import sma
-from bot.strategies.indicators.volatility import volatility_stddev
-from bot.strategies.portfolio_metrics import (
-    compute_unrealized_pnl,
-    compute_last_trade_info,
-    compute_drawdown_status,
-)
+from bot.strategies.indicators.ringbuffer import RingBuffer
+from bot.strategies.indicators.moving_averages import StreamingSMA
+from bot.strategies.indicators.volatility import StreamingVolatility
+from bot.strategies.portfolio_metrics import PortfolioMetricsSnapshot
 from bot.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Metadata reasons (module constants: one shared str object each)
+_R_ENTER = "price_below_mean_threshold"
+_R_EXIT = "mean_reversion_exit"
+_R_HOLD = "mean_reversion_hold"
+
 
 class MeanReversionStrategy(Strategy):
     """
@@ -55,13 +56,27 @@ class MeanReversionStrategy(Strategy):
 
         max_history = int(self.params.get("max_history", self.lookback * 4))
 
-        self.closes = deque(maxlen=max_history)
+        # Preallocated float ring buffer (no per-append allocation)
+        self.closes = RingBuffer(max_history)
+
+        # Rolling SMA of the last `lookback` closes, O(1) per close
+        self._sma = StreamingSMA(self.lookback)
+
+        # Volatility filter state: O(1) per close instead of a
+        # volatility_stddev() pass over vol_window returns.
+        self._vol = StreamingVolatility(self.vol_window) if self.use_volatility else None
+
+        self._last_price: Optional[float] = None
 
         # Computed each candle
         self.mean: Optional[float] = None
         self.deviation: Optional[float] = None
         self.volatility: Optional[float] = None
 
+        # Effective entry threshold for the current bar; it only moves
+        # when the volatility filter widens it.
+        self.threshold: float = self.threshold_pct
+
         if self.lookback <= 0:
             raise ValueError("lookback must be positive")
 
@@ -69,35 +84,51 @@ class MeanReversionStrategy(Strategy):
     # Internal calculation helpers
     # ----------------------------------------------------------------------
 
+    def _push(self, close: float) -> None:
+        """Append a close and roll the streaming state forward."""
+        if self._vol is not None:
+            self._vol.update(close)
+        self.closes.append(close)
+        self._sma.update(close)
+
     def _update_indicators(self) -> None:
         """
         Compute rolling SMA, deviation, and optional volatility.
         """
-        if len(self.closes) < self.lookback:
+        mean = self._sma.value
+        if mean is None:
             self.mean = None
             self.deviation = None
             self.volatility = None
             return
 
         close = self.closes[-1]
-        mean = sma(self.closes, self.lookback)
-
-        if mean is None:
-            self.mean = None
-            self.deviation = None
-            self.volatility = None
-            return
 
         self.mean = mean
         self.deviation = (close - mean) / mean  # fractional deviation
 
         # volatility (optional)
         if self.use_volatility:
-            vol = volatility_stddev(self.closes, self.vol_window)
+            vol = self._vol.value
             self.volatility = vol
+            # Expand threshold based on volatility
+            if vol is not None:
+                self.threshold = max(self.threshold_pct, vol * self.vol_mult)
+            else:
+                self.threshold = self.threshold_pct
         else:
             self.volatility = None
 
+    def _ingest(self, candle) -> None:
+        """Push the candle's close and refresh indicators, once per bar."""
+        if not self._is_new_bar(candle):
+            return
+
+        price = float(candle.close)
+        self._last_price = price
+        self._push(price)
+        self._update_indicators()
+
     def _has_enough_data(self) -> bool:
         return self.mean is not None
 
@@ -106,19 +137,11 @@ class MeanReversionStrategy(Strategy):
     # ----------------------------------------------------------------------
 
     def should_enter(self, candle, portfolio_state) -> bool:
-        close = float(candle.close)
-        self.closes.append(close)
-
-        self._update_indicators()
+        self._ingest(candle)
         if not self._has_enough_data():
             return False
 
-        # Base threshold
-        threshold = self.threshold_pct
-
-        # Expand threshold based on volatility, if enabled
-        if self.use_volatility and self.volatility is not None:
-            threshold = max(threshold, self.volatility * self.vol_mult)
+        threshold = self.threshold
 
         # Enter when price is significantly BELOW the mean
         if self.deviation < -threshold:
@@ -126,7 +149,7 @@ class MeanReversionStrategy(Strategy):
                 "[MEAN_REVERT] ENTER: deviation %.4f < threshold %.4f (close=%.2f mean=%.2f)",
                 self.deviation,
                 threshold,
-                close,
+                self._last_price,
                 self.mean,
             )
             return True
@@ -134,29 +157,16 @@ class MeanReversionStrategy(Strategy):
         return False
 
     def should_exit(self, candle, portfolio_state) -> bool:
-        close = float(candle.close)
-
-        # If no price history yet, append and skip exit
-        if len(self.closes) == 0:
-            self.closes.append(close)
-            return False
-
-        self.closes.append(close)
-        self._update_indicators()
-
+        self._ingest(candle)
         if not self._has_enough_data():
             return False
 
-        threshold = self.threshold_pct
-        if self.use_volatility and self.volatility is not None:
-            threshold = max(threshold, self.volatility * self.vol_mult)
-
         # Exit when price returns near mean or rises above it
-        if self.deviation >= -threshold * 0.25:  # near or above mean
+        if self.deviation >= -self.threshold * 0.25:  # near or above mean
             logger.info(
                 "[MEAN_REVERT] EXIT: deviation %.4f >= reversion_level (close=%.2f mean=%.2f)",
                 self.deviation,
-                close,
+                self._last_price,
                 self.mean,
             )
             return True
@@ -167,57 +177,62 @@ class MeanReversionStrategy(Strategy):
     # Metadata: Unrealized P/L, Volatility, Last Trade, Drawdown
     # ----------------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state) -> StrategySignal:
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: PortfolioMetricsSnapshot | None = None,
+    ) -> StrategySignal:
         sig = super().generate_signal(candle, portfolio_state)
 
-        if sig.metadata is None:
-            sig.metadata = {}
-
-        price = float(candle.close)
+        signal_type = sig.signal_type
+        if signal_type == SignalType.ENTER:
+            reason = _R_ENTER
+        elif signal_type == SignalType.EXIT:
+            reason = _R_EXIT
+        elif not self.emit_hold_metadata:
+            return sig
+        else:
+            reason = (sig.metadata or {}).get("reason", _R_HOLD)
 
-        # --- Portfolio / risk metrics ---
-        unrealized = compute_unrealized_pnl(portfolio_state, price)
-        last_entry_price, last_opened_at, seconds_since_last = compute_last_trade_info(
-            portfolio_state
-        )
-        dd_status = compute_drawdown_status(
-            portfolio_state,
-            unrealized_pnl=unrealized,
-        )
+        # Converted once per bar in _ingest
+        price = self._last_price
 
         # --- Rolling indicator exports (mean reversion context) ---
-        sig.metadata.update(
-            {
-                "strategy": "mean_reversion",
-                "lookback": self.lookback,
-                "threshold_pct": self.threshold_pct,
-                "mean": self.mean,
-                "deviation": self.deviation,
-                "volatility_enabled": self.use_volatility,
-                "volatility": self.volatility,
-                "vol_window": self.vol_window,
-                "vol_mult": self.vol_mult,
-                # Portfolio / P&L metrics
-                "unrealized_pnl": unrealized,
-                "last_entry_price": last_entry_price,
-                "last_trade_opened_at": last_opened_at.isoformat()
-                if last_opened_at
-                else None,
-                "time_since_last_trade_seconds": seconds_since_last,
-                # Drawdown snapshot
-                "current_equity_est": dd_status["current_equity"],
-                "estimated_peak_equity": dd_status["estimated_peak_equity"],
-                "drawdown_abs": dd_status["drawdown_abs"],
-                "drawdown_pct": dd_status["drawdown_pct"],
-                "max_intraday_drawdown": dd_status["max_intraday_drawdown"],
-            }
-        )
-
-        if sig.signal_type == SignalType.ENTER:
-            sig.metadata["reason"] = "price_below_mean_threshold"
-        elif sig.signal_type == SignalType.EXIT:
-            sig.metadata["reason"] = "mean_reversion_exit"
-        else:
-            sig.metadata.setdefault("reason", "mean_reversion_hold")
+        meta = {
+            "reason": reason,
+            "strategy": "mean_reversion",
+            "lookback": self.lookback,
+            "threshold_pct": self.threshold_pct,
+            "mean": self.mean,
+            "deviation": self.deviation,
+            "volatility_enabled": self.use_volatility,
+            "volatility": self.volatility,
+            "vol_window": self.vol_window,
+            "vol_mult": self.vol_mult,
+        }
+
+        if signal_type != SignalType.HOLD or self.emit_hold_metrics:
+            # --- Portfolio / risk metrics ---
+            if pm is None:
+                pm = PortfolioMetricsSnapshot.compute(portfolio_state, price)
+            dd_status = pm.drawdown
+
+            meta.update(
+                {
+                    # Portfolio / P&L metrics
+                    "unrealized_pnl": pm.unrealized_pnl,
+                    "last_entry_price": pm.last_entry_price,
+                    "last_trade_opened_at_ts": pm.last_trade_opened_at_ts,
+                    "time_since_last_trade_seconds": pm.seconds_since_last_trade,
+                    # Drawdown snapshot
+                    "current_equity_est": dd_status["current_equity"],
+                    "estimated_peak_equity": dd_status["estimated_peak_equity"],
+                    "drawdown_abs": dd_status["drawdown_abs"],
+                    "drawdown_pct": dd_status["drawdown_pct"],
+                    "max_intraday_drawdown": dd_status["max_intraday_drawdown"],
+                }
+            )
 
+        sig.metadata = meta
         return sig
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Optional
+import math
+from typing import Iterable, Optional
 
+from bot.strategies._sweep import run_sweep
 from bot.strategies.base import Strategy
 from bot.strategies.signals import StrategySignal, SignalType
-from bot.strategies.indicators.moving_averages import ema
-from bot.strategies.portfolio_metrics import (
-    compute_unrealized_pnl,
-    compute_last_trade_info,
-    compute_drawdown_status,
-)
+from bot.strategies.portfolio_metrics import PortfolioMetricsSnapshot
 from bot.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+_NAN = math.nan
+
+
+def _opt(x: float) -> Optional[float]:
+    """NaN (not yet seeded) -> None for metadata."""
+    return x if x == x else None
+
+# Metadata reasons (module constants: one shared str object each)
+_R_BULL = "bullish_ma_crossover"
+_R_BEAR = "bearish_ma_crossover"
+_R_HOLD = "ma_hold"
+
 
 class MovingAverageCrossoverStrategy(Strategy):
     """
@@ -48,72 +56,99 @@ class MovingAverageCrossoverStrategy(Strategy):
         self.slow_window: int = int(self.params.get("slow_window", 21))
         self.buffer_pct: float = float(self.params.get("buffer_pct", 0.0))
 
+        if self.fast_window <= 0 or self.slow_window <= 0:
+            raise ValueError("EMA windows must be positive")
+
         if self.fast_window >= self.slow_window:
             logger.warning("Fast EMA >= Slow EMA — unusual configuration.")
 
-        max_history: int = int(
-            self.params.get("max_history", max(
-                self.fast_window, self.slow_window) * 4)
-        )
+        # EMA smoothing constants (loop invariants)
+        self._kf = 2.0 / (self.fast_window + 1.0)
+        self._kf1 = 1.0 - self._kf
+        self._ks = 2.0 / (self.slow_window + 1.0)
+        self._ks1 = 1.0 - self._ks
 
-        # Rolling price buffer
-        self.closes = deque(maxlen=max_history)
+        # Crossover thresholds on the slow EMA
+        self._bull_mult = 1.0 + self.buffer_pct
+        self._bear_mult = 1.0 - self.buffer_pct
 
-        # EMA states
-        self.fast_ema: Optional[float] = None
-        self.slow_ema: Optional[float] = None
-        self.prev_fast_ema: Optional[float] = None
-        self.prev_slow_ema: Optional[float] = None
+        # Crossover flags, evaluated once per bar in _update_indicators
+        self._bull = False
+        self._bear = False
+
+        # Bars seen, capped once both EMAs and their previous values exist
+        self._warm_n = 0
+        self._warm_needed = max(self.fast_window, self.slow_window) + 1
+
+        # No price history is kept: each EMA is seeded with the SMA of its
+        # first `window` closes, then updated from the latest price only.
+        self._fast_seed = 0.0
+        self._slow_seed = 0.0
+        self._last_price: Optional[float] = None
+
+        # EMA states: plain floats, NaN until seeded (exported as None)
+        self.fast_ema: float = _NAN
+        self.slow_ema: float = _NAN
+        self.prev_fast_ema: float = _NAN
+        self.prev_slow_ema: float = _NAN
 
     # ------------------------------------------------------------------
     # Indicator Updates
     # ------------------------------------------------------------------
 
     def _update_indicators(self, candle) -> None:
+        if not self._is_new_bar(candle):
+            return
+
         price = float(candle.close)
-        self.closes.append(price)
+        self._last_price = price
 
         # Shift previous values
         self.prev_fast_ema = self.fast_ema
         self.prev_slow_ema = self.slow_ema
 
-        # Streaming EMA updates
-        self.fast_ema = ema(self.closes, self.fast_window,
-                            prev_ema=self.fast_ema)
-        self.slow_ema = ema(self.closes, self.slow_window,
-                            prev_ema=self.slow_ema)
+        if self._warm_n < self._warm_needed:
+            self._warm_n += 1
+
+        # Streaming EMA updates (x != x: still NaN, i.e. not seeded)
+        fast = self.fast_ema
+        if fast != fast:
+            self._fast_seed += price
+            if self._warm_n == self.fast_window:
+                self.fast_ema = self._fast_seed / self.fast_window
+        else:
+            self.fast_ema = price * self._kf + fast * self._kf1
+
+        slow = self.slow_ema
+        if slow != slow:
+            self._slow_seed += price
+            if self._warm_n == self.slow_window:
+                self.slow_ema = self._slow_seed / self.slow_window
+        else:
+            self.slow_ema = price * self._ks + slow * self._ks1
+
+        # Crossovers as sign tests on EMA differences:
+        #   bullish: prev fast <= prev slow, now fast > slow * (1 + buffer)
+        #   bearish: prev fast >= prev slow, now fast < slow * (1 - buffer)
+        if self._has_enough_data():
+            prev_diff = self.prev_fast_ema - self.prev_slow_ema
+            fast = self.fast_ema
+            slow = self.slow_ema
+            self._bull = prev_diff <= 0.0 and fast - slow * self._bull_mult > 0.0
+            self._bear = prev_diff >= 0.0 and fast - slow * self._bear_mult < 0.0
 
     def _has_enough_data(self) -> bool:
-        return (
-            self.fast_ema is not None
-            and self.slow_ema is not None
-            and self.prev_fast_ema is not None
-            and self.prev_slow_ema is not None
-        )
+        return self._warm_n >= self._warm_needed
 
     # ------------------------------------------------------------------
     # Crossover Logic
     # ------------------------------------------------------------------
 
     def _bullish_crossover(self) -> bool:
-        if not self._has_enough_data():
-            return False
-
-        was_below_or_equal = self.prev_fast_ema <= self.prev_slow_ema
-        threshold = 1.0 + self.buffer_pct
-        is_above_now = self.fast_ema > self.slow_ema * threshold
-
-        return was_below_or_equal and is_above_now
+        return self._bull
 
     def _bearish_crossover(self) -> bool:
-        if not self._has_enough_data():
-            return False
-
-        was_above_or_equal = self.prev_fast_ema >= self.prev_slow_ema
-        threshold = 1.0 - self.buffer_pct
-        is_below_now = self.fast_ema < self.slow_ema * threshold
-
-        return was_above_or_equal and is_below_now
+        return self._bear
 
     # ------------------------------------------------------------------
     # Strategy Decisions
@@ -130,8 +165,7 @@ class MovingAverageCrossoverStrategy(Strategy):
 
     def should_exit(self, candle, portfolio_state) -> bool:
         # ensure indicators updated even if runner calls exit first
-        if self.fast_ema is None:
-            self._update_indicators(candle)
+        self._update_indicators(candle)
 
         if self._bearish_crossover():
             logger.info("[MA_XOVER] EXIT signal detected")
@@ -139,58 +173,170 @@ class MovingAverageCrossoverStrategy(Strategy):
 
         return False
 
+    # ------------------------------------------------------------------
+    # Batch evaluation (backtests)
+    # ------------------------------------------------------------------
+
+    def run_batch(self, closes) -> list[str]:
+        """
+        Crossover signals over a close history via ma_crossover_signals
+        (run_batch contract: see Strategy).
+        """
+        return ma_crossover_signals(
+            closes, self.fast_window, self.slow_window, self.buffer_pct
+        )
+
     # ------------------------------------------------------------------
     # Enriched Metadata
     # ------------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state) -> StrategySignal:
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: PortfolioMetricsSnapshot | None = None,
+    ) -> StrategySignal:
         sig = super().generate_signal(candle, portfolio_state)
 
-        if sig.metadata is None:
-            sig.metadata = {}
+        signal_type = sig.signal_type
+        if signal_type == SignalType.ENTER:
+            reason = _R_BULL
+        elif signal_type == SignalType.EXIT:
+            reason = _R_BEAR
+        elif not self.emit_hold_metadata:
+            return sig
+        else:
+            reason = (sig.metadata or {}).get("reason", _R_HOLD)
+
+        # Converted once per bar in _update_indicators
+        price = self._last_price
+
+        meta = {
+            "reason": reason,
+            # Strategy Info
+            "strategy": "moving_average_crossover",
+            "fast_window": self.fast_window,
+            "slow_window": self.slow_window,
+            "buffer_pct": self.buffer_pct,
+            # Indicator Context
+            "fast_ema": _opt(self.fast_ema),
+            "slow_ema": _opt(self.slow_ema),
+            "prev_fast_ema": _opt(self.prev_fast_ema),
+            "prev_slow_ema": _opt(self.prev_slow_ema),
+            "price": price,
+        }
+
+        if signal_type != SignalType.HOLD or self.emit_hold_metrics:
+            # ---- Portfolio Metrics ----
+            if pm is None:
+                pm = PortfolioMetricsSnapshot.compute(portfolio_state, price)
+            dd = pm.drawdown
+
+            meta.update(
+                {
+                    # Trade Context
+                    "unrealized_pnl": pm.unrealized_pnl,
+                    "last_entry_price": pm.last_entry_price,
+                    "last_trade_opened_at_ts": pm.last_trade_opened_at_ts,
+                    "time_since_last_trade_seconds": pm.seconds_since_last_trade,
+                    # Drawdown Context
+                    "current_equity_est": dd["current_equity"],
+                    "estimated_peak_equity": dd["estimated_peak_equity"],
+                    "drawdown_abs": dd["drawdown_abs"],
+                    "drawdown_pct": dd["drawdown_pct"],
+                    "max_intraday_drawdown": dd["max_intraday_drawdown"],
+                }
+            )
+
+        sig.metadata = meta
+        return sig
 
-        price = float(candle.close)
 
-        # ---- Portfolio Metrics ----
-        unrealized = compute_unrealized_pnl(portfolio_state, price)
-        last_entry, opened_at, seconds_since = compute_last_trade_info(
-            portfolio_state)
-        dd = compute_drawdown_status(
-            portfolio_state, unrealized_pnl=unrealized)
-
-        sig.metadata.update(
-            {
-                # Strategy Info
-                "strategy": "moving_average_crossover",
-                "fast_window": self.fast_window,
-                "slow_window": self.slow_window,
-                "buffer_pct": self.buffer_pct,
-                # Indicator Context
-                "fast_ema": self.fast_ema,
-                "slow_ema": self.slow_ema,
-                "prev_fast_ema": self.prev_fast_ema,
-                "prev_slow_ema": self.prev_slow_ema,
-                "price": price,
-                # Trade Context
-                "unrealized_pnl": unrealized,
-                "last_entry_price": last_entry,
-                "last_trade_opened_at": opened_at.isoformat() if opened_at else None,
-                "time_since_last_trade_seconds": seconds_since,
-                # Drawdown Context
-                "current_equity_est": dd["current_equity"],
-                "estimated_peak_equity": dd["estimated_peak_equity"],
-                "drawdown_abs": dd["drawdown_abs"],
-                "drawdown_pct": dd["drawdown_pct"],
-                "max_intraday_drawdown": dd["max_intraday_drawdown"],
-            }
-        )
+# ----------------------------------------------------------------------
+# Batch kernel
+# ----------------------------------------------------------------------
 
-        # Refine reason
-        if sig.signal_type == SignalType.ENTER:
-            sig.metadata["reason"] = "bullish_ma_crossover"
-        elif sig.signal_type == SignalType.EXIT:
-            sig.metadata["reason"] = "bearish_ma_crossover"
+def ma_crossover_signals(
+    closes,
+    fast_window: int,
+    slow_window: int,
+    buffer_pct: float = 0.0,
+) -> list[str]:
+    """
+    EMA crossover signals over a close series, one SignalType per bar.
+
+    Same seeding, smoothing and crossover rules as
+    MovingAverageCrossoverStrategy, as a plain module-level function
+    with everything in locals: no strategy instance is needed, and it
+    pickles cleanly for process-pool parameter sweeps.
+    """
+    n = len(closes)
+    kf = 2.0 / (fast_window + 1.0)
+    kf1 = 1.0 - kf
+    ks = 2.0 / (slow_window + 1.0)
+    ks1 = 1.0 - ks
+    bull_mult = 1.0 + buffer_pct
+    bear_mult = 1.0 - buffer_pct
+
+    ENTER, EXIT, HOLD = SignalType.ENTER, SignalType.EXIT, SignalType.HOLD
+    out = [HOLD] * n
+
+    fast = slow = _NAN
+    fast_seed = slow_seed = 0.0
+    ready_at = max(fast_window, slow_window)  # first bar with prev EMAs
+
+    for i in range(n):
+        price = float(closes[i])
+        prev_fast, prev_slow = fast, slow
+
+        if fast != fast:
+            fast_seed += price
+            if i + 1 == fast_window:
+                fast = fast_seed / fast_window
         else:
-            sig.metadata.setdefault("reason", "ma_hold")
+            fast = price * kf + fast * kf1
 
-        return sig
+        if slow != slow:
+            slow_seed += price
+            if i + 1 == slow_window:
+                slow = slow_seed / slow_window
+        else:
+            slow = price * ks + slow * ks1
+
+        if i < ready_at:
+            continue
+
+        prev_diff = prev_fast - prev_slow
+        if prev_diff <= 0.0 and fast - slow * bull_mult > 0.0:
+            out[i] = ENTER
+        elif prev_diff >= 0.0 and fast - slow * bear_mult < 0.0:
+            out[i] = EXIT
+
+    return out
+
+
+# ----------------------------------------------------------------------
+# Parameter sweeps
+# ----------------------------------------------------------------------
+
+def _sweep_one(closes: list[float], params: tuple[int, int, float]) -> list[str]:
+    fast_window, slow_window, buffer_pct = params
+    return ma_crossover_signals(closes, fast_window, slow_window, buffer_pct)
+
+
+def sweep_ma_crossover(
+    closes,
+    param_grid: Iterable[tuple[int, int, float]],
+    max_workers: int | None = None,
+) -> list[tuple[tuple[int, int, float], list[str]]]:
+    """
+    Run ma_crossover_signals for every (fast_window, slow_window,
+    buffer_pct) in `param_grid`, spread across worker processes.
+
+    Parameter sets are independent, so the sweep scales with cores; the
+    close series is shipped to each worker once. Returns
+    [(params, signals), ...] in grid order for the caller to score.
+    """
+    grid = [(int(f), int(s), float(b)) for f, s, b in param_grid]
+    results = run_sweep(_sweep_one, closes, grid, max_workers)
+    return list(zip(grid, results))
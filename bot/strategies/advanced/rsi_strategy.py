@@ -2,18 +2,14 @@
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Optional
+from typing import Iterable, Optional
 
+from bot.strategies._sweep import run_sweep
 from bot.strategies.base import Strategy
 from bot.strategies.signals import StrategySignal, SignalType
-from bot.strategies.indicators.rsi import rsi
-from bot.strategies.indicators.volatility import volatility_stddev
-from bot.strategies.portfolio_metrics import (
-    compute_unrealized_pnl,
-    compute_last_trade_info,
-    compute_drawdown_status,
-)
+from bot.strategies.indicators.rsi import rsi_series
+from bot.strategies.indicators.volatility import StreamingVolatility, log_return
+from bot.strategies.portfolio_metrics import PortfolioMetricsSnapshot
 from bot.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +34,28 @@ class RSIStrategy(Strategy):
       - Drawdown info
     """
 
+    # Fixed attribute layout: faster per-bar attribute access and a
+    # smaller footprint when a sweep builds thousands of instances.
+    __slots__ = (
+        "period",
+        "lower",
+        "upper",
+        "use_volatility",
+        "vol_window",
+        "vol_mult",
+        "_vol",
+        "rsi_val",
+        "volatility",
+        "prev_avg_gain",
+        "prev_avg_loss",
+        "_prev_close",
+        "_seed_n",
+        "_seed_gain",
+        "_seed_loss",
+        "_last_price",
+        "_step",
+    )
+
     def __init__(self, params: dict | None = None):
         super().__init__(params)
 
@@ -51,53 +69,86 @@ class RSIStrategy(Strategy):
         self.vol_window = int(self.params.get("vol_window", 20))
         self.vol_mult = float(self.params.get("vol_mult", 1.0))
 
-        max_history = int(self.params.get("max_history", self.period * 4))
+        if self.period <= 0:
+            raise ValueError("period must be positive")
+
+        # Wilder's RSI and the volatility filter are both O(1) per close,
+        # so no price history is kept.
+        self._vol = StreamingVolatility(self.vol_window) if self.use_volatility else None
 
-        self.closes = deque(maxlen=max_history)
+        # Per-close update, picked once: the common no-volatility case
+        # runs the bare Wilder step with no filter checks at all.
+        self._step = self._update_with_vol if self._vol is not None else self._update
 
         # Indicator state
         self.rsi_val: Optional[float] = None
         self.volatility: Optional[float] = None
+        self.prev_avg_gain: Optional[float] = None
+        self.prev_avg_loss: Optional[float] = None
+
+        # Wilder seed: plain averages of the first `period` gains / losses
+        self._prev_close: Optional[float] = None
+        self._seed_n = 0
+        self._seed_gain = 0.0
+        self._seed_loss = 0.0
+        self._last_price: Optional[float] = None
 
     # -------------------------------------------------------------------------
     # RSI / volatility calculation
     # -------------------------------------------------------------------------
 
-    def _update_indicators(self) -> None:
-        # Not enough data to compute RSI
-        if len(self.closes) < self.period:
-            self.rsi_val = None
-            self.prev_avg_gain = None
-            self.prev_avg_loss = None
-            self.volatility = None
+    def _update_indicators(self, candle) -> None:
+        if not self._is_new_bar(candle):
             return
+        self._step(float(candle.close))
 
-        arr = list(self.closes)
+    def _update(self, close: float) -> None:
+        self._last_price = close
 
-        # Get RSI result (may return None or a tuple)
-        result = rsi(
-            arr,
-            self.period,
-            prev_avg_gain=self.prev_avg_gain,
-            prev_avg_loss=self.prev_avg_loss,
-        )
-
-        if result is None:
-            self.rsi_val = None
+        prev_close = self._prev_close
+        self._prev_close = close
+        if prev_close is None:
             return
 
-        # Unpack tuple from RSI indicator
-        rsi_val, avg_gain, avg_loss = result
+        delta = close - prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        period = self.period
+        prev_avg_gain = self.prev_avg_gain
+
+        if prev_avg_gain is None:
+            # Still collecting the first `period` deltas
+            self._seed_gain += gain
+            self._seed_loss += loss
+            self._seed_n += 1
+            if self._seed_n < period:
+                return
+            avg_gain = self._seed_gain / period
+            avg_loss = self._seed_loss / period
+        else:
+            # Wilder's smoothing
+            avg_gain = (prev_avg_gain * (period - 1) + gain) / period
+            avg_loss = (self.prev_avg_loss * (period - 1) + loss) / period
 
-        self.rsi_val = float(rsi_val)
-        self.prev_avg_gain = float(avg_gain)
-        self.prev_avg_loss = float(avg_loss)
+        self.prev_avg_gain = avg_gain
+        self.prev_avg_loss = avg_loss
 
-        # Volatility (optional)
-        if self.use_volatility:
-            self.volatility = volatility_stddev(arr, self.vol_window)
+        if avg_loss == 0:
+            self.rsi_val = 100.0  # RSI is maxed
         else:
-            self.volatility = None
+            self.rsi_val = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def _update_with_vol(self, close: float) -> None:
+        # One step for both indicators: the volatility return comes from
+        # the same previous close the RSI delta uses.
+        vol = self._vol
+        prev_close = self._prev_close
+        if prev_close is not None:
+            vol.push_return(log_return(prev_close, close))
+        self._update(close)
+        # Volatility is reported alongside RSI, from the first seeded bar
+        if self.rsi_val is not None:
+            self.volatility = vol.value
 
     def _has_enough_data(self) -> bool:
         return self.rsi_val is not None
@@ -107,104 +158,207 @@ class RSIStrategy(Strategy):
     # -------------------------------------------------------------------------
 
     def should_enter(self, candle, portfolio_state) -> bool:
-        close = float(candle.close)
-        self.closes.append(close)
+        self._update_indicators(candle)
 
-        self._update_indicators()
-
-        if not self._has_enough_data():
+        rsi_val = self.rsi_val
+        if rsi_val is None:
             return False
 
         # Oversold → enter long
-        if self.rsi_val < self.lower:
+        lower = self.lower
+        if rsi_val < lower:
             logger.info(
                 "[RSI] ENTER oversold: RSI=%.2f < lower=%.2f",
-                self.rsi_val,
-                self.lower,
+                rsi_val,
+                lower,
             )
             return True
 
         return False
 
     def should_exit(self, candle, portfolio_state) -> bool:
-        close = float(candle.close)
-
-        # Ensure we have enough price history
-        if len(self.closes) == 0:
-            self.closes.append(close)
-            return False
-
-        self.closes.append(close)
-        self._update_indicators()
+        # ensure indicators updated even if runner calls exit first
+        self._update_indicators(candle)
 
-        if not self._has_enough_data():
+        rsi_val = self.rsi_val
+        if rsi_val is None:
             return False
 
         # Overbought → exit
-        if self.rsi_val > self.upper:
+        upper = self.upper
+        if rsi_val > upper:
             logger.info(
                 "[RSI] EXIT overbought: RSI=%.2f > upper=%.2f",
-                self.rsi_val,
-                self.upper,
+                rsi_val,
+                upper,
             )
             return True
 
         return False
 
+    # -------------------------------------------------------------------------
+    # Batch evaluation (backtests)
+    # -------------------------------------------------------------------------
+
+    def feed_soa(self, highs, lows, closes, i: int) -> str:
+        """
+        Column feed (contract: see Strategy). Only closes drive RSI;
+        highs / lows are accepted for a uniform feed signature.
+        """
+        self._step(closes[i])
+        rsi_val = self.rsi_val
+        if rsi_val is None:
+            return SignalType.HOLD
+        if rsi_val < self.lower:
+            return SignalType.ENTER
+        if rsi_val > self.upper:
+            return SignalType.EXIT
+        return SignalType.HOLD
+
+    def run_batch(self, closes) -> list[str]:
+        """
+        RSI threshold signals over a close history via rsi_signals
+        (run_batch contract: see Strategy). The volatility filter is
+        reported in metadata only, so it plays no part here.
+        """
+        return rsi_signals(closes, self.period, self.lower, self.upper)
+
     # -------------------------------------------------------------------------
     # Enriched Metadata
     # -------------------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state) -> StrategySignal:
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: PortfolioMetricsSnapshot | None = None,
+    ) -> StrategySignal:
         sig = super().generate_signal(candle, portfolio_state)
 
-        if sig.metadata is None:
-            sig.metadata = {}
-
-        price = float(candle.close)
+        signal_type = sig.signal_type
+        if signal_type == SignalType.ENTER:
+            reason = "rsi_oversold_entry"
+        elif signal_type == SignalType.EXIT:
+            reason = "rsi_overbought_exit"
+        elif not self.emit_hold_metadata:
+            return sig
+        else:
+            reason = (sig.metadata or {}).get("reason", "rsi_hold")
 
-        # ---- Portfolio Metrics ----
-        unrealized = compute_unrealized_pnl(portfolio_state, price)
-        last_entry_price, opened_at, seconds_since_last = compute_last_trade_info(
-            portfolio_state
-        )
-        dd_state = compute_drawdown_status(
-            portfolio_state,
-            unrealized_pnl=unrealized,
-        )
+        # Converted once per bar in _update_indicators
+        price = self._last_price
 
         # ---- Rolling Indicator Exports ----
-        sig.metadata.update(
-            {
-                "strategy": "rsi",
-                "period": self.period,
-                "lower_threshold": self.lower,
-                "upper_threshold": self.upper,
-                "rsi": self.rsi_val,
-                "use_volatility": self.use_volatility,
-                "volatility": self.volatility,
-                "vol_window": self.vol_window,
-                "vol_mult": self.vol_mult,
-                # Portfolio & Risk Info
-                "unrealized_pnl": unrealized,
-                "last_entry_price": last_entry_price,
-                "last_trade_opened_at": opened_at.isoformat() if opened_at else None,
-                "time_since_last_trade_seconds": seconds_since_last,
-                # Drawdown Info
-                "current_equity_est": dd_state["current_equity"],
-                "estimated_peak_equity": dd_state["estimated_peak_equity"],
-                "drawdown_abs": dd_state["drawdown_abs"],
-                "drawdown_pct": dd_state["drawdown_pct"],
-                "max_intraday_drawdown": dd_state["max_intraday_drawdown"],
-            }
-        )
-
-        # ---- Signal Reason ----
-        if sig.signal_type == SignalType.ENTER:
-            sig.metadata["reason"] = "rsi_oversold_entry"
-        elif sig.signal_type == SignalType.EXIT:
-            sig.metadata["reason"] = "rsi_overbought_exit"
-        else:
-            sig.metadata.setdefault("reason", "rsi_hold")
+        meta = {
+            "reason": reason,
+            "strategy": "rsi",
+            "period": self.period,
+            "lower_threshold": self.lower,
+            "upper_threshold": self.upper,
+            "rsi": self.rsi_val,
+            "use_volatility": self.use_volatility,
+            "volatility": self.volatility,
+            "vol_window": self.vol_window,
+            "vol_mult": self.vol_mult,
+        }
+
+        if signal_type != SignalType.HOLD or self.emit_hold_metrics:
+            # ---- Portfolio Metrics ----
+            if pm is None:
+                pm = PortfolioMetricsSnapshot.compute(portfolio_state, price)
+            dd_state = pm.drawdown
+
+            meta.update(
+                {
+                    # Portfolio & Risk Info
+                    "unrealized_pnl": pm.unrealized_pnl,
+                    "last_entry_price": pm.last_entry_price,
+                    "last_trade_opened_at_ts": pm.last_trade_opened_at_ts,
+                    "time_since_last_trade_seconds": pm.seconds_since_last_trade,
+                    # Drawdown Info
+                    "current_equity_est": dd_state["current_equity"],
+                    "estimated_peak_equity": dd_state["estimated_peak_equity"],
+                    "drawdown_abs": dd_state["drawdown_abs"],
+                    "drawdown_pct": dd_state["drawdown_pct"],
+                    "max_intraday_drawdown": dd_state["max_intraday_drawdown"],
+                }
+            )
 
+        sig.metadata = meta
         return sig
+
+
+# -----------------------------------------------------------------------------
+# Batch kernel
+# -----------------------------------------------------------------------------
+
+def _threshold_signals(rsi_vals: list[float], lower: float, upper: float) -> list[str]:
+    ENTER, EXIT, HOLD = SignalType.ENTER, SignalType.EXIT, SignalType.HOLD
+    # NaN (not seeded) fails both comparisons -> HOLD
+    return [
+        ENTER if v < lower else EXIT if v > upper else HOLD
+        for v in rsi_vals
+    ]
+
+
+def rsi_signals(
+    closes,
+    period: int,
+    lower: float = 30.0,
+    upper: float = 70.0,
+) -> list[str]:
+    """
+    RSI oversold / overbought signals over a close series, one SignalType
+    per bar.
+
+    Same Wilder seeding and smoothing as RSIStrategy, as a plain
+    module-level function with all state in locals (picklable for
+    process-pool sweeps).
+    """
+    return _threshold_signals(rsi_series(closes, period), lower, upper)
+
+
+# -----------------------------------------------------------------------------
+# Parameter sweeps
+# -----------------------------------------------------------------------------
+
+def _sweep_period(
+    closes: list[float],
+    task: tuple[int, list[tuple[float, float]]],
+) -> list[list[str]]:
+    period, bands = task
+    rsi_vals = rsi_series(closes, period)
+    return [_threshold_signals(rsi_vals, lower, upper) for lower, upper in bands]
+
+
+def sweep_rsi(
+    closes,
+    param_grid: Iterable[tuple[int, float, float]],
+    max_workers: int | None = None,
+) -> list[tuple[tuple[int, float, float], list[str]]]:
+    """
+    Run rsi_signals for every (period, lower, upper) in `param_grid`.
+
+    The RSI series depends only on `period`, so the grid is grouped by
+    period: each group computes the Wilder recurrence once and applies
+    all of its (lower, upper) bands to it. Groups are spread across
+    worker processes, each of which receives the close series once.
+    Returns [(params, signals), ...] in grid order.
+    """
+    grid = [(int(p), float(lo), float(up)) for p, lo, up in param_grid]
+    if not grid:
+        return []
+
+    groups: dict[int, list[tuple[float, float]]] = {}
+    for period, lower, upper in grid:
+        groups.setdefault(period, []).append((lower, upper))
+    tasks = list(groups.items())
+
+    results = run_sweep(_sweep_period, closes, tasks, max_workers)
+    by_params = {
+        (period, lower, upper): signals
+        for (period, bands), group in zip(tasks, results)
+        for (lower, upper), signals in zip(bands, group)
+    }
+
+    return [(params, by_params[params]) for params in grid]
@@ -2,21 +2,16 @@
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Optional
 
 from bot.strategies.base import Strategy
 from bot.strategies.signals import StrategySignal, SignalType
+from bot.strategies.indicators.ringbuffer import RingBuffer
 from bot.strategies.indicators.support_resistance import (
-    find_support_resistance,
-    bounce_from_support,
-    reject_from_resistance,
-)
-from bot.strategies.portfolio_metrics import (
-    compute_unrealized_pnl,
-    compute_last_trade_info,
-    compute_drawdown_status,
+    StreamingSupportResistance,
+    level_band,
 )
+from bot.strategies.portfolio_metrics import PortfolioMetricsSnapshot
 from bot.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,6 +35,23 @@ class SupportResistanceStrategy(Strategy):
       - Volatility-ready structure
     """
 
+    # Fixed attribute layout: faster per-bar attribute access and a
+    # smaller footprint when a sweep builds thousands of instances.
+    __slots__ = (
+        "left",
+        "right",
+        "lookback",
+        "tolerance_pct",
+        "highs",
+        "lows",
+        "closes",
+        "_levels",
+        "support",
+        "resistance",
+        "_sup_band",
+        "_res_band",
+    )
+
     def __init__(self, params: dict | None = None):
         super().__init__(params)
 
@@ -50,52 +62,66 @@ class SupportResistanceStrategy(Strategy):
 
         max_history = int(self.params.get("max_history", self.lookback * 2))
 
-        self.highs = deque(maxlen=max_history)
-        self.lows = deque(maxlen=max_history)
-        self.closes = deque(maxlen=max_history)
+        # Preallocated float ring buffers (no per-append allocation)
+        self.highs = RingBuffer(max_history)
+        self.lows = RingBuffer(max_history)
+        self.closes = RingBuffer(max_history)
+
+        # Swing-point levels, updated in O(left + right) per bar
+        self._levels = StreamingSupportResistance(
+            left=self.left,
+            right=self.right,
+            lookback=self.lookback,
+            max_history=max_history,
+        )
 
         # Cached S/R levels
         self.support: Optional[float] = None
         self.resistance: Optional[float] = None
 
+        # Price bands around each level, recomputed only when it moves
+        self._sup_band = level_band(None)
+        self._res_band = level_band(None)
+
     # ---------------------------------------------------------------
     # Support/Resistance Updates
     # ---------------------------------------------------------------
 
-    def _update_levels(self) -> None:
-        self.support, self.resistance = find_support_resistance(
-            highs=self.highs,
-            lows=self.lows,
-            left=self.left,
-            right=self.right,
-            lookback=self.lookback,
-        )
+    def _update_levels(self, high: float, low: float) -> None:
+        support, resistance = self._levels.update(high, low)
+        if support != self.support:
+            self.support = support
+            self._sup_band = level_band(support, self.tolerance_pct)
+        if resistance != self.resistance:
+            self.resistance = resistance
+            self._res_band = level_band(resistance, self.tolerance_pct)
+
+    def _ingest(self, high: float, low: float, close: float) -> None:
+        self.highs.append(high)
+        self.lows.append(low)
+        self.closes.append(close)
+        self._update_levels(high, low)
+
+    def _ingest_candle(self, candle) -> None:
+        if not self._is_new_bar(candle):
+            return
+        self._ingest(float(candle.high), float(candle.low), float(candle.close))
 
     # ---------------------------------------------------------------
     # Strategy Logic
     # ---------------------------------------------------------------
 
-    def should_enter(self, candle, portfolio_state) -> bool:
-        close = float(candle.close)
-
-        self.highs.append(float(candle.high))
-        self.lows.append(float(candle.low))
-        self.closes.append(close)
-
-        if len(self.closes) < 2:
+    def _bounce(self) -> bool:
+        closes = self.closes
+        if len(closes) < 2:
             return False
 
-        self._update_levels()
+        close = closes[-1]
+        prev_close = closes[-2]
+        lo, hi = self._sup_band
 
-        prev_close = self.closes[-2]
-
-        # Entry: bounce from support
-        if bounce_from_support(
-            close=close,
-            prev_close=prev_close,
-            support=self.support,
-            tolerance_pct=self.tolerance_pct,
-        ):
+        # Entry: bounce from support (previous close near support, now rising)
+        if lo <= prev_close <= hi and close > prev_close:
             logger.info(
                 "[SUPPORT] ENTER bounce @ %.2f (support=%.2f)",
                 close,
@@ -105,30 +131,17 @@ class SupportResistanceStrategy(Strategy):
 
         return False
 
-    def should_exit(self, candle, portfolio_state) -> bool:
-        close = float(candle.close)
-
-        if len(self.closes) == 0:
-            self.highs.append(float(candle.high))
-            self.lows.append(float(candle.low))
-            self.closes.append(close)
+    def _rejection(self) -> bool:
+        closes = self.closes
+        if len(closes) < 2:
             return False
 
-        self.highs.append(float(candle.high))
-        self.lows.append(float(candle.low))
-        self.closes.append(close)
-
-        self._update_levels()
+        close = closes[-1]
+        prev_close = closes[-2]
+        lo, hi = self._res_band
 
-        prev_close = self.closes[-2]
-
-        # Exit: rejection from resistance
-        if reject_from_resistance(
-            close=close,
-            prev_close=prev_close,
-            resistance=self.resistance,
-            tolerance_pct=self.tolerance_pct,
-        ):
+        # Exit: rejection from resistance (previous close near it, now falling)
+        if lo <= prev_close <= hi and close < prev_close:
             logger.info(
                 "[RESISTANCE] EXIT rejection @ %.2f (resistance=%.2f)",
                 close,
@@ -138,59 +151,89 @@ class SupportResistanceStrategy(Strategy):
 
         return False
 
+    def should_enter(self, candle, portfolio_state) -> bool:
+        self._ingest_candle(candle)
+        return self._bounce()
+
+    def should_exit(self, candle, portfolio_state) -> bool:
+        self._ingest_candle(candle)
+        return self._rejection()
+
+    # ---------------------------------------------------------------
+    # Column-oriented feed (backtests)
+    # ---------------------------------------------------------------
+
+    def feed_soa(self, highs, lows, closes, i: int) -> str:
+        """
+        Column feed (contract: see Strategy): ingests bar `i`, then the
+        bounce / rejection checks generate_signal uses.
+        """
+        self._ingest(highs[i], lows[i], closes[i])
+        if self._bounce():
+            return SignalType.ENTER
+        if self._rejection():
+            return SignalType.EXIT
+        return SignalType.HOLD
+
     # ---------------------------------------------------------------
     # Enriched Metadata
     # ---------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state) -> StrategySignal:
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: PortfolioMetricsSnapshot | None = None,
+    ) -> StrategySignal:
         sig = super().generate_signal(candle, portfolio_state)
 
-        if sig.metadata is None:
-            sig.metadata = {}
-
-        price = float(candle.close)
+        signal_type = sig.signal_type
+        if signal_type == SignalType.ENTER:
+            reason = "bounce_from_support"
+        elif signal_type == SignalType.EXIT:
+            reason = "reject_from_resistance"
+        elif not self.emit_hold_metadata:
+            return sig
+        else:
+            reason = (sig.metadata or {}).get("reason", "sr_hold")
 
-        # ---- Portfolio & Risk Metrics ----
-        unrealized = compute_unrealized_pnl(portfolio_state, price)
-        last_entry_price, opened_at, seconds_since = compute_last_trade_info(
-            portfolio_state
-        )
-        dd = compute_drawdown_status(
-            portfolio_state,
-            unrealized_pnl=unrealized,
-        )
+        # Converted once per bar in _ingest_candle
+        price = self.closes[-1]
 
         # ---- Strategy-Specific Metadata ----
-        sig.metadata.update(
-            {
-                "strategy": "support_resistance",
-                "left": self.left,
-                "right": self.right,
-                "lookback": self.lookback,
-                "tolerance_pct": self.tolerance_pct,
-                "support": self.support,
-                "resistance": self.resistance,
-                "last_close": price,
-                # Portfolio Metrics
-                "unrealized_pnl": unrealized,
-                "last_entry_price": last_entry_price,
-                "last_trade_opened_at": opened_at.isoformat() if opened_at else None,
-                "time_since_last_trade_seconds": seconds_since,
-                # Drawdown Metrics
-                "current_equity_est": dd["current_equity"],
-                "estimated_peak_equity": dd["estimated_peak_equity"],
-                "drawdown_abs": dd["drawdown_abs"],
-                "drawdown_pct": dd["drawdown_pct"],
-                "max_intraday_drawdown": dd["max_intraday_drawdown"],
-            }
-        )
-
-        # ---- Signal Reasoning ----
-        if sig.signal_type == SignalType.ENTER:
-            sig.metadata["reason"] = "bounce_from_support"
-        elif sig.signal_type == SignalType.EXIT:
-            sig.metadata["reason"] = "reject_from_resistance"
-        else:
-            sig.metadata.setdefault("reason", "sr_hold")
+        meta = {
+            "reason": reason,
+            "strategy": "support_resistance",
+            "left": self.left,
+            "right": self.right,
+            "lookback": self.lookback,
+            "tolerance_pct": self.tolerance_pct,
+            "support": self.support,
+            "resistance": self.resistance,
+            "last_close": price,
+        }
+
+        if signal_type != SignalType.HOLD or self.emit_hold_metrics:
+            # ---- Portfolio & Risk Metrics ----
+            if pm is None:
+                pm = PortfolioMetricsSnapshot.compute(portfolio_state, price)
+            dd = pm.drawdown
+
+            meta.update(
+                {
+                    # Portfolio Metrics
+                    "unrealized_pnl": pm.unrealized_pnl,
+                    "last_entry_price": pm.last_entry_price,
+                    "last_trade_opened_at_ts": pm.last_trade_opened_at_ts,
+                    "time_since_last_trade_seconds": pm.seconds_since_last_trade,
+                    # Drawdown Metrics
+                    "current_equity_est": dd["current_equity"],
+                    "estimated_peak_equity": dd["estimated_peak_equity"],
+                    "drawdown_abs": dd["drawdown_abs"],
+                    "drawdown_pct": dd["drawdown_pct"],
+                    "max_intraday_drawdown": dd["max_intraday_drawdown"],
+                }
+            )
 
+        sig.metadata = meta
         return sig
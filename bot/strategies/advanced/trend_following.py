@@ -2,18 +2,14 @@
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Optional
+from typing import Optional, Tuple
 
 from bot.strategies.base import Strategy
 from bot.strategies.signals import StrategySignal, SignalType
-from bot.strategies.indicators.moving_averages import ema
-from bot.strategies.indicators.volatility import atr
-from bot.strategies.portfolio_metrics import (
-    compute_unrealized_pnl,
-    compute_last_trade_info,
-    compute_drawdown_status,
-)
+from bot.strategies.indicators.ringbuffer import RingBuffer
+from bot.strategies.indicators.moving_averages import ema, ema_step
+from bot.strategies.indicators.volatility import atr, atr_step, true_range_step
+from bot.strategies.portfolio_metrics import DrawdownTracker, PortfolioMetricsSnapshot
 from bot.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -36,6 +32,31 @@ class TrendFollowingStrategy(Strategy):
       - Drawdown info
     """
 
+    # Fixed attribute layout: faster per-bar attribute access and a
+    # smaller footprint when a sweep builds thousands of instances.
+    __slots__ = (
+        "ema_period",
+        "confirm_period",
+        "_ema_alpha",
+        "use_atr",
+        "atr_period",
+        "atr_mult",
+        "buffer_pct",
+        "closes",
+        "highs",
+        "lows",
+        "ema_val",
+        "prev_ema",
+        "atr_val",
+        "_upper_th",
+        "_lower_th",
+        "_above",
+        "_below",
+        "above_count",
+        "below_count",
+        "_drawdown",
+    )
+
     def __init__(self, params: dict | None = None):
         super().__init__(params)
 
@@ -48,76 +69,96 @@ class TrendFollowingStrategy(Strategy):
         self.atr_mult = float(self.params.get("atr_mult", 1.0))
         self.buffer_pct = float(self.params.get("buffer_pct", 0.0))
 
+        if self.ema_period <= 0:
+            raise ValueError("ema_period must be positive")
+
+        # EMA smoothing factor, fixed for the strategy's lifetime
+        self._ema_alpha = 2.0 / (self.ema_period + 1.0)
+
         max_history = int(self.params.get("max_history", self.ema_period * 4))
 
-        self.closes = deque(maxlen=max_history)
-        self.highs = deque(maxlen=max_history)
-        self.lows = deque(maxlen=max_history)
+        # Preallocated float ring buffers (no per-append allocation)
+        self.closes = RingBuffer(max_history)
+        self.highs = RingBuffer(max_history)
+        self.lows = RingBuffer(max_history)
 
         # states
         self.ema_val: Optional[float] = None
         self.prev_ema: Optional[float] = None
         self.atr_val: Optional[float] = None
 
+        # EMA ± buffer bands, recomputed once per bar
+        self._upper_th: Optional[float] = None
+        self._lower_th: Optional[float] = None
+
+        # Which side of those bands the latest close is on
+        self._above = False
+        self._below = False
+
         # confirmation counters
         self.above_count = 0
         self.below_count = 0
 
+        # Running peak of the equity estimates reported in metadata
+        self._drawdown = DrawdownTracker()
+
     # ----------------------------------------------------------------------
     # Indicator Update
     # ----------------------------------------------------------------------
 
     def _update_indicators(self, candle):
-        price = float(candle.close)
-
-        self.closes.append(price)
-        self.highs.append(float(candle.high))
-        self.lows.append(float(candle.low))
+        if not self._is_new_bar(candle):
+            return
 
-        # EMA update
-        new_ema = ema(self.closes, self.ema_period, prev_ema=self.ema_val)
-        self.prev_ema = self.ema_val
+        price = float(candle.close)
+        high = float(candle.high)
+        low = float(candle.low)
+
+        closes = self.closes
+        prev_close = closes[-1] if len(closes) else None
+        closes.append(price)
+        self.highs.append(high)
+        self.lows.append(low)
+
+        # EMA update: bootstrap from history once, then one O(1) step
+        prev_ema = self.ema_val
+        if prev_ema is None:
+            new_ema = ema(closes, self.ema_period, alpha=self._ema_alpha)
+        else:
+            new_ema = ema_step(prev_ema, price, self._ema_alpha)
+        self.prev_ema = prev_ema
         self.ema_val = new_ema
 
-        # ATR update
-        self.atr_val = atr(
-            self.highs,
-            self.lows,
-            self.closes,
-            period=self.atr_period,
-            prev_atr=self.atr_val,
-        )
-
-    def _has_enough_data(self):
-        return self.ema_val is not None and self.prev_ema is not None
-
-    # ----------------------------------------------------------------------
-    # Trend Conditions
-    # ----------------------------------------------------------------------
+        # ATR update: same pattern
+        atr_val = self.atr_val
+        if atr_val is None:
+            self.atr_val = atr(self.highs, self.lows, closes, period=self.atr_period)
+        else:
+            tr = true_range_step(high, low, prev_close)
+            self.atr_val = atr_step(atr_val, tr, self.atr_period)
 
-    def _price_above_ema(self) -> bool:
-        price = self.closes[-1]
-        ema_val = self.ema_val
+        if new_ema is not None:
+            self._update_thresholds(new_ema, price)
 
-        buffer = 0.0
-        if self.use_atr and self.atr_val:
-            buffer = self.atr_val * self.atr_mult
+    def _update_thresholds(self, ema_val: float, price: float) -> None:
+        atr_val = self.atr_val
+        if self.use_atr and atr_val:
+            buffer = atr_val * self.atr_mult
         elif self.buffer_pct:
             buffer = ema_val * self.buffer_pct
+        else:
+            buffer = 0.0
 
-        return price > (ema_val + buffer)
-
-    def _price_below_ema(self) -> bool:
-        price = self.closes[-1]
-        ema_val = self.ema_val
+        upper = self._upper_th = ema_val + buffer
+        lower = self._lower_th = ema_val - buffer
 
-        buffer = 0.0
-        if self.use_atr and self.atr_val:
-            buffer = self.atr_val * self.atr_mult
-        elif self.buffer_pct:
-            buffer = ema_val * self.buffer_pct
+        # Both sides are tracked: with a negative buffer the bands cross
+        # and a close can be above the upper and below the lower at once.
+        self._above = price > upper
+        self._below = price < lower
 
-        return price < (ema_val - buffer)
+    def _has_enough_data(self):
+        return self.ema_val is not None and self.prev_ema is not None
 
     # ----------------------------------------------------------------------
     # Entry & Exit Logic
@@ -129,10 +170,8 @@ class TrendFollowingStrategy(Strategy):
         if not self._has_enough_data():
             return False
 
-        if self._price_above_ema():
-            self.above_count += 1
-        else:
-            self.above_count = 0
+        # Run length of closes above the band; any miss resets it to 0
+        self.above_count = (self.above_count + 1) * self._above
 
         if self.above_count >= self.confirm_period:
             logger.info(
@@ -147,19 +186,13 @@ class TrendFollowingStrategy(Strategy):
         return False
 
     def should_exit(self, candle, portfolio_state):
-        if len(self.closes) == 0:
-            self._update_indicators(candle)
-            return False
-
         self._update_indicators(candle)
 
         if not self._has_enough_data():
             return False
 
-        if self._price_below_ema():
-            self.below_count += 1
-        else:
-            self.below_count = 0
+        # Run length of closes below the band; any miss resets it to 0
+        self.below_count = (self.below_count + 1) * self._below
 
         if self.below_count >= self.confirm_period:
             logger.info(
@@ -174,62 +207,235 @@ class TrendFollowingStrategy(Strategy):
         return False
 
     # ----------------------------------------------------------------------
-    # Enriched Metadata
+    # Batch evaluation (backtests)
     # ----------------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state):
-        sig = super().generate_signal(candle, portfolio_state)
-
-        if sig.metadata is None:
-            sig.metadata = {}
+    def run_batch(self, closes, highs, lows) -> list[str]:
+        """
+        Trend-confirmation signals over close / high / low histories via
+        trend_signals (run_batch contract: see Strategy).
+        """
+        return trend_signals(
+            closes,
+            highs,
+            lows,
+            ema_period=self.ema_period,
+            confirm_period=self.confirm_period,
+            use_atr=self.use_atr,
+            atr_period=self.atr_period,
+            atr_mult=self.atr_mult,
+            buffer_pct=self.buffer_pct,
+            max_history=self.closes.maxlen,
+        )
 
-        price = float(candle.close)
+    # ----------------------------------------------------------------------
+    # Enriched Metadata
+    # ----------------------------------------------------------------------
 
-        # ---- Portfolio Metrics ----
-        unrealized = compute_unrealized_pnl(portfolio_state, price)
-        last_entry_price, opened_at, seconds_since = compute_last_trade_info(
-            portfolio_state
-        )
-        dd_state = compute_drawdown_status(
-            portfolio_state,
-            unrealized_pnl=unrealized,
+    def _observe_equity(self, portfolio_state, price: float) -> None:
+        """
+        Feed this bar's equity estimate to the drawdown tracker.
+
+        Same estimate as compute_drawdown_status (last snapshot equity +
+        unrealized P/L), read from PortfolioState's cached floats so HOLD
+        bars that emit no metadata pay a few float ops, not a metrics pass.
+        """
+        if portfolio_state is None:
+            return
+        equity = portfolio_state.ending_equity_float
+        if equity is None:
+            return
+        self._drawdown.update(
+            equity
+            + price * portfolio_state.open_size_float
+            - portfolio_state.open_cost_float
         )
 
-        # ---- Indicator Metadata ----
-        sig.metadata.update(
-            {
-                "strategy": "trend_following",
-                "ema_period": self.ema_period,
-                "confirm_period": self.confirm_period,
-                "ema": self.ema_val,
-                "prev_ema": self.prev_ema,
-                "above_count": self.above_count,
-                "below_count": self.below_count,
-                "atr": self.atr_val,
-                "atr_period": self.atr_period,
-                "atr_mult": self.atr_mult,
-                "buffer_pct": self.buffer_pct,
-                "last_close": price,
-                # Portfolio & Risk
-                "unrealized_pnl": unrealized,
-                "last_entry_price": last_entry_price,
-                "last_trade_opened_at": opened_at.isoformat() if opened_at else None,
-                "time_since_last_trade_seconds": seconds_since,
-                # Drawdown Info
-                "current_equity_est": dd_state["current_equity"],
-                "estimated_peak_equity": dd_state["estimated_peak_equity"],
-                "drawdown_abs": dd_state["drawdown_abs"],
-                "drawdown_pct": dd_state["drawdown_pct"],
-                "max_intraday_drawdown": dd_state["max_intraday_drawdown"],
-            }
+    def _track_drawdown(
+        self,
+        dd_state: dict,
+    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        (peak_equity, drawdown_abs, drawdown_pct) for this bar: the running
+        equity peak, never below the snapshot's estimated peak. The
+        snapshot's recorded drawdown stands until the running peak shows a
+        deeper one, so a fresh strategy doesn't report zero drawdown.
+        """
+        current = dd_state["current_equity"]
+        snap = (
+            dd_state["estimated_peak_equity"],
+            dd_state["drawdown_abs"],
+            dd_state["drawdown_pct"],
         )
+        if current is None:
+            return snap
+
+        tracked = self._drawdown.update(current, snap[0])
+        if snap[1] is not None and snap[1] > tracked[1]:
+            return snap
+        return tracked
+
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: PortfolioMetricsSnapshot | None = None,
+    ) -> StrategySignal:
+        sig = super().generate_signal(candle, portfolio_state)
 
-        # ---- Reasoning ----
-        if sig.signal_type == SignalType.ENTER:
-            sig.metadata["reason"] = "trend_up_confirmed"
-        elif sig.signal_type == SignalType.EXIT:
-            sig.metadata["reason"] = "trend_down_confirmed"
+        # Converted once per bar in _update_indicators
+        price = self.closes[-1]
+
+        # The running equity peak sees every bar, including HOLD bars that
+        # return below without metadata.
+        self._observe_equity(portfolio_state, price)
+
+        signal_type = sig.signal_type
+        if signal_type == SignalType.ENTER:
+            reason = "trend_up_confirmed"
+        elif signal_type == SignalType.EXIT:
+            reason = "trend_down_confirmed"
+        elif not self.emit_hold_metadata:
+            return sig
         else:
-            sig.metadata.setdefault("reason", "trend_hold")
+            reason = (sig.metadata or {}).get("reason", "trend_hold")
+
+        # ---- Indicator Metadata ----
+        meta = {
+            "reason": reason,
+            "strategy": "trend_following",
+            "ema_period": self.ema_period,
+            "confirm_period": self.confirm_period,
+            "ema": self.ema_val,
+            "prev_ema": self.prev_ema,
+            "above_count": self.above_count,
+            "below_count": self.below_count,
+            "atr": self.atr_val,
+            "atr_period": self.atr_period,
+            "atr_mult": self.atr_mult,
+            "buffer_pct": self.buffer_pct,
+            "last_close": price,
+        }
+
+        if signal_type != SignalType.HOLD or self.emit_hold_metrics:
+            # ---- Portfolio Metrics ----
+            if pm is None:
+                pm = PortfolioMetricsSnapshot.compute(portfolio_state, price)
+            dd_state = pm.drawdown
+            peak, dd_abs, dd_pct = self._track_drawdown(dd_state)
+
+            meta.update(
+                {
+                    # Portfolio & Risk
+                    "unrealized_pnl": pm.unrealized_pnl,
+                    "last_entry_price": pm.last_entry_price,
+                    "last_trade_opened_at_ts": pm.last_trade_opened_at_ts,
+                    "time_since_last_trade_seconds": pm.seconds_since_last_trade,
+                    # Drawdown Info
+                    "current_equity_est": dd_state["current_equity"],
+                    "estimated_peak_equity": peak,
+                    "drawdown_abs": dd_abs,
+                    "drawdown_pct": dd_pct,
+                    "max_intraday_drawdown": dd_state["max_intraday_drawdown"],
+                }
+            )
 
+        sig.metadata = meta
         return sig
+
+
+# ----------------------------------------------------------------------
+# Batch kernel
+# ----------------------------------------------------------------------
+
+def trend_signals(
+    closes,
+    highs,
+    lows,
+    ema_period: int = 50,
+    confirm_period: int = 3,
+    use_atr: bool = False,
+    atr_period: int = 14,
+    atr_mult: float = 1.0,
+    buffer_pct: float = 0.0,
+    max_history: int | None = None,
+) -> list[str]:
+    """
+    EMA trend-confirmation signals over parallel close / high / low
+    series, one SignalType per bar.
+
+    Same EMA / ATR seeding and smoothing, buffers and confirmation
+    counters as TrendFollowingStrategy, as a plain module-level function
+    with everything in locals. `max_history` is the strategy's history
+    size: an EMA or ATR that needs more bars than it holds never seeds.
+    """
+    if ema_period <= 0:
+        raise ValueError("window must be positive")
+
+    n = len(closes)
+    alpha = 2.0 / (ema_period + 1.0)
+    atr_keep = atr_period - 1
+    ema_seeds = max_history is None or max_history >= ema_period
+    atr_seeds = max_history is None or max_history >= atr_period + 1
+
+    ENTER, EXIT, HOLD = SignalType.ENTER, SignalType.EXIT, SignalType.HOLD
+    out = [HOLD] * n
+
+    ema_val = prev_ema = atr_val = None
+    ema_seed = 0.0
+    tr_sum = 0.0
+    above = below = 0
+    prev_close = None
+
+    for i in range(n):
+        price = float(closes[i])
+        high = float(highs[i])
+        low = float(lows[i])
+
+        # EMA: SMA seed over the first `ema_period` closes, then streaming
+        prev_ema = ema_val
+        if ema_val is not None:
+            ema_val = (price - ema_val) * alpha + ema_val
+        elif ema_seeds:
+            ema_seed += price
+            if i + 1 == ema_period:
+                ema_val = ema_seed / ema_period
+
+        # ATR: mean of the first `atr_period` true ranges, then Wilder
+        if prev_close is not None and atr_seeds:
+            tr = max(
+                high - low,
+                abs(high - prev_close),
+                abs(low - prev_close),
+            )
+            if atr_val is not None:
+                atr_val = (atr_val * atr_keep + tr) / atr_period
+            else:
+                tr_sum += tr
+                if i == atr_period:
+                    atr_val = tr_sum / atr_period
+        prev_close = price
+
+        if ema_val is None or prev_ema is None:
+            continue
+
+        if use_atr and atr_val:
+            buffer = atr_val * atr_mult
+        elif buffer_pct:
+            buffer = ema_val * buffer_pct
+        else:
+            buffer = 0.0
+
+        # should_enter, then should_exit only if it didn't fire
+        above = (above + 1) * (price > ema_val + buffer)
+        if above >= confirm_period:
+            below = 0
+            out[i] = ENTER
+            continue
+
+        below = (below + 1) * (price < ema_val - buffer)
+        if below >= confirm_period:
+            above = 0
+            out[i] = EXIT
+
+    return out
@@ -1,11 +1,29 @@
+import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from bot.core.logger import get_logger
 from bot.strategies.signals import StrategySignal, SignalType
 
+if TYPE_CHECKING:
+    # Type hint only: portfolio_metrics pulls in the persistence layer,
+    # which needs DATABASE_URL at import time.
+    from bot.strategies.portfolio_metrics import PortfolioMetricsSnapshot
+
 logger = get_logger(__name__)
 
+# Shared HOLD result for strategies with emit_hold_metadata off: every
+# such bar returns this one object instead of allocating a new signal.
+# It carries no price or timestamp and must never be mutated; callers
+# that keep or store signals (StrategyRunner) fill those in from the
+# candle on their own copy.
+_HOLD_SIGNAL = StrategySignal(
+    timestamp=None,
+    signal_type=SignalType.HOLD,
+    price=None,
+    metadata=None,
+)
+
 
 class Strategy:
     """
@@ -15,10 +33,55 @@ class Strategy:
         - should_exit(candle, portfolio_state)
 
     HOLD is automatically produced when neither rule triggers.
+
+    Common params:
+        - emit_hold_metadata: bool  # attach metadata to HOLD signals
+                                    # (default True; backtests that never
+                                    # read HOLD metadata can turn it off,
+                                    # and every HOLD then returns one
+                                    # shared, payload-free signal)
+        - emit_hold_metrics: bool   # include portfolio / drawdown metrics
+                                    # in HOLD metadata (default True; off
+                                    # keeps only the indicator context)
+
+    Subclasses may declare __slots__ for their own state; those that
+    don't simply get a per-instance __dict__ as usual.
+
+    Optional backtest entry points, where a strategy provides them:
+        - run_batch(...) -> list[str]
+            One SignalType per bar over a whole price history: the same
+            types generate_signal would emit bar by bar, without candle
+            objects, method dispatch, logging or metadata. Uses the
+            instance's parameters and leaves its streaming state untouched.
+        - feed_soa(highs, lows, closes, i) -> str
+            Advance the live state by bar `i` of parallel, already-float
+            columns and return its SignalType: generate_signal's rules
+            without attribute lookups, float() casts or metadata. Bars
+            must be fed in order.
     """
 
+    __slots__ = ("params", "emit_hold_metadata", "emit_hold_metrics", "_last_bar_ts")
+
     def __init__(self, params: dict | None = None):
         self.params = params or {}
+        self.emit_hold_metadata = bool(self.params.get("emit_hold_metadata", True))
+        self.emit_hold_metrics = bool(self.params.get("emit_hold_metrics", True))
+        self._last_bar_ts: Optional[datetime] = None
+
+    def _is_new_bar(self, candle) -> bool:
+        """
+        True the first time a candle's bar is seen.
+
+        generate_signal hands the same candle to should_enter and then
+        should_exit, and either may be called first. Strategies that keep
+        rolling state ingest the candle behind this check, so each bar is
+        applied exactly once.
+        """
+        ts = candle.timestamp
+        if ts == self._last_bar_ts:
+            return False
+        self._last_bar_ts = ts
+        return True
 
     # ------------------------------------------------------------------
     # Rules every strategy must implement
@@ -34,18 +97,29 @@ class Strategy:
     # Generate a StrategySignal (ENTER / EXIT / HOLD)
     # ------------------------------------------------------------------
 
-    def generate_signal(self, candle, portfolio_state) -> StrategySignal:
-        """Evaluate entry/exit logic and return a StrategySignal."""
+    def generate_signal(
+        self,
+        candle,
+        portfolio_state,
+        pm: "Optional[PortfolioMetricsSnapshot]" = None,
+    ) -> StrategySignal:
+        """
+        Evaluate entry/exit logic and return a StrategySignal.
+
+        `pm` is an optional PortfolioMetricsSnapshot for this bar; callers
+        running several strategies on one portfolio compute it once and
+        pass it to each. Strategies that report portfolio metrics compute
+        their own when it is omitted.
+        """
 
-        ts = datetime.now(timezone.utc)
         price = candle.close
 
         # ---- ENTER ----
         if self.should_enter(candle, portfolio_state):
             meta = {"reason": "enter_rule_triggered"}
-            logger.info(f"[SIGNAL] ENTER @ {price}")
+            logger.info("[SIGNAL] ENTER @ %s", price)
             return StrategySignal(
-                timestamp=ts,
+                timestamp=datetime.now(timezone.utc),
                 signal_type=SignalType.ENTER,
                 price=price,
                 metadata=meta,
@@ -54,20 +128,25 @@ class Strategy:
         # ---- EXIT ----
         if self.should_exit(candle, portfolio_state):
             meta = {"reason": "exit_rule_triggered"}
-            logger.info(f"[SIGNAL] EXIT @ {price}")
+            logger.info("[SIGNAL] EXIT @ %s", price)
             return StrategySignal(
-                timestamp=ts,
+                timestamp=datetime.now(timezone.utc),
                 signal_type=SignalType.EXIT,
                 price=price,
                 metadata=meta,
             )
 
         # ---- HOLD (default) ----
-        meta = {"reason": "hold_default"}
-        logger.debug(f"[SIGNAL] HOLD @ {price}")
+        # Most bars end here: skip the call entirely unless DEBUG is on
+        # (isEnabledFor answers from the logger's own level cache).
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SIGNAL] HOLD @ %s", price)
+        if not self.emit_hold_metadata:
+            # No clock read either: the shared signal has no timestamp
+            return _HOLD_SIGNAL
         return StrategySignal(
-            timestamp=ts,
+            timestamp=datetime.now(timezone.utc),
             signal_type=SignalType.HOLD,
             price=price,
-            metadata=meta,
+            metadata={"reason": "hold_default"},
         )
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from itertools import islice
 from typing import Optional
 
+from bot.strategies.indicators.ringbuffer import RingBuffer
+
 
 def sma(values: Sequence[float], window: int) -> Optional[float]:
     """
@@ -27,21 +30,67 @@ def sma(values: Sequence[float], window: int) -> Optional[float]:
         raise ValueError("window must be positive")
 
 
-    if not isinstance(values, list):
-            values = list(values)
-            
-    if len(values) < window:
+    n = len(values)
+    if n < window:
         return None
 
-    # Use only the last `window` items
-    subset = values[-window:]
-    return float(sum(subset) / window)
+    # Use only the last `window` items (no copy of the full history)
+    return float(sum(islice(values, n - window, None)) / window)
+
+
+class StreamingSMA:
+    """
+    Simple Moving Average fed one value at a time, O(1) per update.
+
+    Keeps a running sum of the last `window` values (adding the new value
+    and subtracting the one that falls out) instead of re-summing the
+    window like sma(). The sum is rebuilt from the buffer every
+    RESYNC_EVERY updates so rounding error can't accumulate.
+
+    Usage:
+        sma20 = StreamingSMA(20)
+        for close in closes:
+            sma20.update(close)
+        sma20.value  # None until `window` values are available
+    """
+
+    RESYNC_EVERY = 1024
+
+    __slots__ = ("window", "_values", "_sum", "_pushes")
+
+    def __init__(self, window: int):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._values = RingBuffer(window)
+        self._sum = 0.0
+        self._pushes = 0
+
+    def update(self, value: float) -> Optional[float]:
+        """Add the next value; returns the current SMA."""
+        old = self._values.append(value)
+        self._pushes += 1
+        if old is None:
+            self._sum += value
+        elif self._pushes >= self.RESYNC_EVERY:
+            self._pushes = 0
+            self._sum = sum(self._values)
+        else:
+            self._sum += value - old
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self._values) < self.window:
+            return None
+        return self._sum / self.window
 
 
 def ema(
     values: Sequence[float],
     window: int,
     prev_ema: Optional[float] = None,
+    alpha: Optional[float] = None,
 ) -> Optional[float]:
     """
     Exponential Moving Average (EMA) with optional previous EMA.
@@ -59,6 +108,9 @@ def ema(
         EMA period (e.g. 9, 21, 50).
     prev_ema : float | None
         Previous EMA value. If None, will be computed from history.
+    alpha : float | None
+        Precomputed smoothing factor 2 / (window + 1), for callers that
+        keep it across calls. Derived from `window` if None.
 
     Returns
     -------
@@ -68,14 +120,12 @@ def ema(
     if window <= 0:
         raise ValueError("window must be positive")
 
-    if not isinstance(values, list):
-        values = list(values)
-
     n = len(values)
     if n == 0:
         return None
 
-    alpha = 2.0 / (window + 1.0)
+    if alpha is None:
+        alpha = 2.0 / (window + 1.0)
 
     # Not enough data to even bootstrap
     if prev_ema is None and n < window:
@@ -83,18 +133,28 @@ def ema(
 
     # If we already have an EMA, update using only the latest price.
     if prev_ema is not None:
-        latest_price = float(values[-1])
-        return float((latest_price - prev_ema) * alpha + prev_ema)
+        return ema_step(prev_ema, float(values[-1]), alpha)
 
     # Otherwise, bootstrap EMA from SMA of first `window` points.
     # values: [v0, v1, ..., v_{n-1}]
     # 1) Compute SMA of first `window` values as initial EMA.
-    initial_sma = sum(values[:window]) / window
+    initial_sma = sum(islice(values, window)) / window
     ema_val = float(initial_sma)
 
-    # 2) Apply EMA update for remaining values.
-    for price in values[window:]:
-        price = float(price)
+    # 2) Apply EMA update for remaining values (map() does the float
+    #    conversion in C rather than a float() call per iteration).
+    for price in map(float, islice(values, window, None)):
         ema_val = (price - ema_val) * alpha + ema_val
 
-    return float(ema_val)
+    return ema_val
+
+
+def ema_step(prev_ema: float, price: float, alpha: float) -> float:
+    """
+    Single streaming EMA update with a precomputed smoothing factor
+    (alpha = 2 / (window + 1)).
+
+    Equivalent to ema(values, window, prev_ema) without touching the
+    history, for per-bar hot paths that already hold the latest price.
+    """
+    return (price - prev_ema) * alpha + prev_ema
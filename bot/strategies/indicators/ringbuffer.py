@@ -0,0 +1,78 @@
+# bot/strategies/indicators/ringbuffer.py
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterator, Optional
+
+
+class RingBuffer:
+    """
+    Fixed-capacity float ring buffer backed by a contiguous array('d').
+
+    Drop-in for the ``deque(maxlen=N)`` price histories used by strategies:
+      - append() overwrites the oldest value once full (and returns it)
+      - len(), iteration and indexing are in logical order, oldest first
+      - negative indices count from the newest value (buf[-1] = latest)
+      - slicing returns a list
+
+    Storage is preallocated once and holds raw doubles rather than boxed
+    Python floats, so a long backtest never reallocates.
+    """
+
+    __slots__ = ("_data", "_cap", "_head", "_len")
+
+    def __init__(self, maxlen: int):
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self._data = array("d", bytes(8 * maxlen))
+        self._cap = maxlen
+        self._head = 0  # physical index of the next write
+        self._len = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._cap
+
+    def append(self, value: float) -> Optional[float]:
+        """Append a value; returns the evicted oldest value once full."""
+        head = self._head
+        evicted = self._data[head] if self._len == self._cap else None
+        self._data[head] = value
+        head += 1
+        self._head = 0 if head == self._cap else head
+        if evicted is None:
+            self._len += 1
+        return evicted
+
+    def clear(self) -> None:
+        self._head = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _physical(self, i: int) -> int:
+        n = self._len
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("RingBuffer index out of range")
+        j = self._head - n + i
+        return j + self._cap if j < 0 else j
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._data[self._physical(k)] for k in range(*i.indices(self._len))]
+        return self._data[self._physical(i)]
+
+    def __iter__(self) -> Iterator[float]:
+        data = self._data
+        start = self._head - self._len
+        if start >= 0:
+            return iter(data[start:self._head])
+        # Wrapped: tail segment first, then the front of the array.
+        return iter(data[start + self._cap:] + data[:self._head])
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({list(self)!r}, maxlen={self._cap})"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Sequence
 from typing import Optional, Tuple
 
@@ -49,6 +50,34 @@ def _bootstrap_rsi(values: Sequence[float], period: int) -> Optional[Tuple[float
     return float(rsi), float(avg_gain), float(avg_loss)
 
 
+def rsi_step(
+    prev_avg_gain: float,
+    prev_avg_loss: float,
+    delta: float,
+    period: int,
+) -> Tuple[float, float, float]:
+    """
+    Single streaming RSI update from the latest price change.
+
+    Applies Wilder's smoothing to the previous average gain / loss.
+
+    Returns
+    -------
+    (rsi, avg_gain, avg_loss)
+    """
+    gain = max(delta, 0.0)
+    loss = max(-delta, 0.0)
+
+    avg_gain = (prev_avg_gain * (period - 1) + gain) / period
+    avg_loss = (prev_avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0:
+        return 100.0, avg_gain, avg_loss  # RSI is maxed
+
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs)), avg_gain, avg_loss
+
+
 def rsi(
     values: Sequence[float],
     period: int,
@@ -87,21 +116,72 @@ def rsi(
 
     # If we have previous gain/loss, update using only last delta.
     if prev_avg_gain is not None and prev_avg_loss is not None:
-        delta = values[-1] - values[-2]
+        return rsi_step(
+            prev_avg_gain, prev_avg_loss, values[-1] - values[-2], period
+        )
+
+    # Otherwise, bootstrap.
+    return _bootstrap_rsi(values, period)
 
-        gain = max(delta, 0.0)
-        loss = max(-delta, 0.0)
 
-        avg_gain = (prev_avg_gain * (period - 1) + gain) / period
-        avg_loss = (prev_avg_loss * (period - 1) + loss) / period
+def rsi_series(values: Sequence[float], period: int) -> list[float]:
+    """
+    Wilder's RSI for every bar of a series in one pass.
+
+    Seeds with the plain averages of the first `period` gains / losses
+    (as `_bootstrap_rsi` does), then applies Wilder's smoothing bar by
+    bar: the same values the streaming `rsi()` updates would produce,
+    without re-slicing the history each step.
+
+    Parameters
+    ----------
+    values : sequence of floats, oldest -> newest
+    period : int
+
+    Returns
+    -------
+    list of floats, same length as `values`; NaN until `period + 1`
+    values have been seen.
+    """
+    if period <= 0:
+        raise ValueError("period must be positive")
 
+    n = len(values)
+    out = [math.nan] * n
+    if n <= period:
+        return out
+
+    # Seed: plain averages of the first `period` gains / losses
+    gain_sum = loss_sum = 0.0
+    prev = float(values[0])
+    for i in range(1, period + 1):
+        close = float(values[i])
+        delta = close - prev
+        prev = close
+        if delta > 0:
+            gain_sum += delta
+        elif delta < 0:
+            loss_sum -= delta
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
+    keep = period - 1
+
+    i = period
+    while True:
         if avg_loss == 0:
-            return 100.0, float(avg_gain), float(avg_loss)
+            out[i] = 100.0
+        else:
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
 
-        rs = avg_gain / avg_loss
-        rsi_val = 100 - (100 / (1 + rs))
+        i += 1
+        if i >= n:
+            break
 
-        return float(rsi_val), float(avg_gain), float(avg_loss)
+        # Wilder's smoothing
+        close = float(values[i])
+        delta = close - prev
+        prev = close
+        avg_gain = (avg_gain * keep + (delta if delta > 0 else 0.0)) / period
+        avg_loss = (avg_loss * keep + (-delta if delta < 0 else 0.0)) / period
 
-    # Otherwise, bootstrap.
-    return _bootstrap_rsi(values, period)
+    return out
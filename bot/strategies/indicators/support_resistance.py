@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import math
+from collections import deque
 from collections.abc import Sequence
+from itertools import islice
 from typing import Optional, Tuple
 
 
@@ -79,18 +82,37 @@ def find_support_resistance(
     if n < left + right + 1:
         return None, None
 
-    start = max(0, n - lookback)
+    # Only bars with `left` / `right` neighbours can be swing points
+    start = max(left, n - lookback)
+    stop = n - right
+
+    # One contiguous copy of just the scanned tail (deques and ring
+    # buffers don't slice), then each neighbour test is a C-level
+    # max()/min() over a slice. Indices below are shifted by `base`.
+    base = start - left
+    highs = list(islice(highs, base, None))
+    lows = list(islice(lows, base, None))
+    start -= base
+    stop -= base
 
     support = None
     resistance = None
 
     # Walk backwards from the most recent candle
-    for i in range(n - 1, start - 1, -1):
-        if resistance is None and is_swing_high(highs, i, left, right):
-            resistance = highs[i]
-
-        if support is None and is_swing_low(lows, i, left, right):
-            support = lows[i]
+    for i in range(stop - 1, start - 1, -1):
+        if resistance is None:
+            pivot = highs[i]
+            if (left == 0 or max(highs[i - left:i]) < pivot) and (
+                right == 0 or max(highs[i + 1:i + right + 1]) < pivot
+            ):
+                resistance = pivot
+
+        if support is None:
+            pivot = lows[i]
+            if (left == 0 or min(lows[i - left:i]) > pivot) and (
+                right == 0 or min(lows[i + 1:i + right + 1]) > pivot
+            ):
+                support = pivot
 
         if support is not None and resistance is not None:
             break
@@ -98,6 +120,103 @@ def find_support_resistance(
     return support, resistance
 
 
+class StreamingSupportResistance:
+    """
+    Incremental find_support_resistance() for one bar at a time.
+
+    A bar can only be confirmed as a swing point once its `right`
+    neighbours exist, i.e. `right` bars later, and that verdict never
+    changes. So each update checks the single newly confirmable bar
+    (O(left + right)) and remembers the most recent swing high / low.
+    Since find_support_resistance() returns the most recent swing points
+    inside the lookback window, the answer is either that remembered
+    pivot or None once it has aged out.
+
+    `max_history` mirrors a bounded history buffer (deque maxlen) that
+    find_support_resistance() would otherwise be called on: pivots whose
+    left neighbours have been evicted no longer qualify.
+    """
+
+    __slots__ = (
+        "left",
+        "right",
+        "lookback",
+        "max_history",
+        "_highs",
+        "_lows",
+        "_t",
+        "_res_idx",
+        "_resistance",
+        "_sup_idx",
+        "_support",
+    )
+
+    def __init__(
+        self,
+        left: int = 3,
+        right: int = 3,
+        lookback: int = 100,
+        max_history: Optional[int] = None,
+    ):
+        self.left = left
+        self.right = right
+        self.lookback = lookback
+        self.max_history = max_history
+
+        span = left + right + 1
+        self._highs: deque = deque(maxlen=span)
+        self._lows: deque = deque(maxlen=span)
+
+        self._t = -1  # index of the latest bar
+        self._res_idx = -1
+        self._resistance: Optional[float] = None
+        self._sup_idx = -1
+        self._support: Optional[float] = None
+
+    def update(self, high: float, low: float) -> Tuple[Optional[float], Optional[float]]:
+        """Add the next bar; returns (support_level, resistance_level)."""
+        self._t += 1
+        highs = self._highs
+        lows = self._lows
+        highs.append(high)
+        lows.append(low)
+
+        left = self.left
+        span = highs.maxlen
+        if len(highs) == span:
+            pivot_idx = self._t - self.right
+
+            # Strictly above (below) every neighbour <=> it is the window
+            # max (min) and nothing ties it: two C-level passes each.
+            pivot = highs[left]
+            if pivot == max(highs) and highs.count(pivot) == 1:
+                self._res_idx = pivot_idx
+                self._resistance = pivot
+
+            pivot = lows[left]
+            if pivot == min(lows) and lows.count(pivot) == 1:
+                self._sup_idx = pivot_idx
+                self._support = pivot
+
+        return self.levels()
+
+    def levels(self) -> Tuple[Optional[float], Optional[float]]:
+        """(support_level, resistance_level) as of the latest bar."""
+        seen = self._t + 1
+        oldest = seen - self.lookback
+        if self.max_history is not None:
+            held = min(seen, self.max_history)
+            if held < self._highs.maxlen:
+                return None, None
+            # Pivot needs its left neighbours still in the buffer
+            oldest = max(oldest, seen - held + self.left)
+
+        # Unset levels are None, so no separate "found" check is needed
+        support = self._support if self._sup_idx >= oldest else None
+        resistance = self._resistance if self._res_idx >= oldest else None
+        return support, resistance
+
+
 # ----------------------------------------------------------------------
 # Support/Resistance proximity checks
 # ----------------------------------------------------------------------
@@ -119,6 +238,27 @@ def near_level(
     return diff <= tolerance_pct
 
 
+def level_band(
+    level: Optional[float],
+    tolerance_pct: float = 0.005,
+) -> Tuple[float, float]:
+    """
+    Precompute the (low, high) price band for which near_level(price,
+    level, tolerance_pct) holds, so repeated checks against the same
+    level are two comparisons instead of a subtraction and a division.
+
+    An empty band (inf, -inf) never matches.
+    """
+    if level is None or level == 0:
+        return math.inf, -math.inf
+
+    if level < 0:
+        # near_level's relative diff is negative here, so any price matches
+        return -math.inf, math.inf
+
+    return level * (1.0 - tolerance_pct), level * (1.0 + tolerance_pct)
+
+
 def bounce_from_support(
     close: float,
     prev_close: float,
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from itertools import islice
 from typing import Optional, Tuple
 import math
 
+from bot.strategies.indicators.ringbuffer import RingBuffer
+
 
 # -----------------------------------------------------------
 # True Range (TR)
@@ -30,10 +33,14 @@ def true_range(
     if n < 2:
         return None
 
-    high = float(highs[-1])
-    low = float(lows[-1])
-    prev_close = float(closes[-2])
+    return true_range_step(float(highs[-1]), float(lows[-1]), float(closes[-2]))
+
 
+def true_range_step(high: float, low: float, prev_close: float) -> float:
+    """
+    True Range of one bar given the previous close, for per-bar hot
+    paths that already hold the latest values.
+    """
     return max(
         high - low,
         abs(high - prev_close),
@@ -66,31 +73,33 @@ def atr(
     if n < period + 1:  # Need period TR's + 1 previous close
         return None
 
-    # Compute the latest True Range
-    tr = true_range(highs, lows, closes)
-    if tr is None:
-        return None
-
-    # Streaming update
+    # Streaming update: only the latest True Range is needed.
     if prev_atr is not None:
-        # Wilder's smoothing:
-        # ATR_t = (prev_ATR * (period - 1) + TR_t) / period
-        new_atr = (prev_atr * (period - 1) + tr) / period
-        return float(new_atr)
+        tr = true_range_step(float(highs[-1]), float(lows[-1]), float(closes[-2]))
+        return atr_step(prev_atr, tr, period)
 
     # Bootstrap ATR using first `period` TRs
-    trs = []
-    # TRs computed from candle 1..period
-    for i in range(1, period + 1):
-        tr_i = max(
-            highs[i] - lows[i],
-            abs(highs[i] - closes[i - 1]),
-            abs(lows[i] - closes[i - 1]),
-        )
-        trs.append(float(tr_i))
+    # TRs computed from candle 1..period, zipped in one pass (no
+    # per-element indexing into the histories)
+    total = 0.0
+    for high, low, prev_close in zip(
+        islice(highs, 1, period + 1),
+        islice(lows, 1, period + 1),
+        islice(closes, period),
+    ):
+        total += true_range_step(high, low, prev_close)
 
-    initial_atr = sum(trs) / period
-    return float(initial_atr)
+    return total / period
+
+
+def atr_step(prev_atr: float, tr: float, period: int) -> float:
+    """
+    Single streaming ATR update from the latest True Range.
+
+    Wilder's smoothing:
+        ATR_t = (prev_ATR * (period - 1) + TR_t) / period
+    """
+    return (prev_atr * (period - 1) + tr) / period
 
 
 # -----------------------------------------------------------
@@ -110,23 +119,123 @@ def volatility_stddev(
         - adaptive stop sizing
         - trend filters
 
-    Returns None if insufficient data.
+    Returns None if insufficient data or if a close in the window is
+    non-positive (log return undefined).
     """
     n = len(closes)
     if n < window + 1:
         return None
 
-    # Compute log returns on last `window` periods
-    returns = []
-    for i in range(n - window, n):
-        prev = float(closes[i - 1])
-        curr = float(closes[i])
-        if prev <= 0:
-            return None
-        log_ret = math.log(curr / prev)
-        returns.append(log_ret)
+    # Last `window` + 1 closes, converted once (no full-history copy)
+    tail = list(map(float, islice(closes, n - window - 1, None)))
+    if min(tail) <= 0:
+        return None
+
+    # Welford's one-pass variance over the last `window` log returns:
+    # no intermediate returns list, and no cancellation from a separate
+    # mean pass.
+    log = math.log
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for prev, curr in zip(tail, islice(tail, 1, None)):
+        r = log(curr / prev)
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+
+    return math.sqrt(m2 / count)
+
+
+# -----------------------------------------------------------
+# Streaming Volatility (O(1) per close)
+# -----------------------------------------------------------
+def log_return(prev: float, close: float) -> float:
+    """ln(close / prev), or NaN when either price is non-positive."""
+    return math.log(close / prev) if prev > 0 and close > 0 else math.nan
+
+
+class StreamingVolatility:
+    """
+    Rolling standard deviation of log returns, fed one close at a time.
+
+    Gives the same value as volatility_stddev(closes, window) over the
+    closes seen so far, without re-walking the window: log returns are
+    kept in a RingBuffer and a sliding-window Welford mean / M2 is
+    updated as each return enters and the oldest one leaves.
+
+    Usage:
+        vol = StreamingVolatility(20)
+        for close in closes:
+            vol.update(close)
+        vol.value  # None until `window` returns are available
+    """
 
-    # Standard deviation
-    mean_ret = sum(returns) / len(returns)
-    variance = sum((r - mean_ret) ** 2 for r in returns) / len(returns)
-    return float(math.sqrt(variance))
+    __slots__ = ("window", "_returns", "_prev", "_mean", "_m2", "_bad")
+
+    def __init__(self, window: int):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._returns = RingBuffer(window)
+        self._prev: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._bad = 0  # undefined returns (price <= 0) still in window
+
+    def update(self, close: float) -> Optional[float]:
+        """Add the next close; returns the current volatility."""
+        prev = self._prev
+        self._prev = close
+        if prev is not None:
+            self.push_return(log_return(prev, close))
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        n = self.window
+        if self._bad or len(self._returns) < n:
+            return None
+        return math.sqrt(max(self._m2 / n, 0.0))
+
+    def push_return(self, ret: float) -> None:
+        """
+        Add the next log return directly (NaN if undefined).
+
+        For callers that already track the previous close: skips update()'s
+        own bookkeeping and its volatility read. Don't mix with update().
+        """
+        rets = self._returns
+        old = rets.append(ret)
+
+        bad_in = ret != ret
+        bad_out = old is not None and old != old
+        self._bad += bad_in - bad_out
+        if self._bad:
+            return
+        if bad_out:
+            # The last undefined return just left the window; the running
+            # stats were frozen meanwhile, so rebuild them once.
+            self._resync()
+            return
+
+        n = len(rets)
+        mean = self._mean
+        if old is None:
+            # Window still filling: plain Welford update
+            delta = ret - mean
+            mean += delta / n
+            self._m2 += delta * (ret - mean)
+        else:
+            # Full window: replace `old` with `ret`
+            new_mean = mean + (ret - old) / n
+            self._m2 += (ret - old) * (ret - new_mean + old - mean)
+            mean = new_mean
+        self._mean = mean
+
+    def _resync(self) -> None:
+        rets = list(self._returns)
+        mean = sum(rets) / len(rets)
+        self._mean = mean
+        self._m2 = sum((r - mean) ** 2 for r in rets)
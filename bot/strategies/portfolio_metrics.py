@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional, Tuple
 
@@ -35,6 +36,12 @@ def compute_unrealized_pnl(
         return 0.0
 
     price = float(current_price)
+
+    # PortfolioState keeps the open size / cost sums up to date
+    cost = getattr(portfolio_state, "open_cost_float", None)
+    if cost is not None:
+        return price * portfolio_state.open_size_float - cost
+
     total = 0.0
 
     for trade in portfolio_state.open_trades:
@@ -153,3 +160,84 @@ def compute_drawdown_status(
         "drawdown_pct": drawdown_pct,
         "max_intraday_drawdown": max_dd,
     }
+
+
+# --------------------------------------------------------------------
+# Running peak / drawdown (streaming)
+# --------------------------------------------------------------------
+class DrawdownTracker:
+    """
+    Running peak and drawdown over a stream of equity values, O(1) per
+    update, for callers that see one equity estimate per bar.
+    """
+
+    __slots__ = ("peak",)
+
+    def __init__(self):
+        self.peak: Optional[float] = None
+
+    def update(
+        self,
+        equity: float,
+        known_peak: Optional[float] = None,
+    ) -> Tuple[float, float, Optional[float]]:
+        """
+        Add the next equity value. `known_peak` is a peak recorded
+        elsewhere (e.g. a snapshot estimate) that the running peak must
+        not fall below.
+
+        Returns (peak_equity, drawdown_abs, drawdown_pct); drawdown_pct
+        is None while the peak is not positive.
+        """
+        peak = self.peak
+        if known_peak is not None and (peak is None or known_peak > peak):
+            peak = known_peak
+        if peak is None or equity > peak:
+            peak = equity
+        self.peak = peak
+
+        drawdown = peak - equity
+        return peak, drawdown, (drawdown / peak if peak > 0 else None)
+
+
+# --------------------------------------------------------------------
+# Per-bar snapshot (shared across strategies)
+# --------------------------------------------------------------------
+@dataclass(slots=True)
+class PortfolioMetricsSnapshot:
+    """
+    Everything the three metric helpers above report, computed once.
+
+    When several strategies evaluate the same portfolio on the same bar,
+    build one snapshot and hand it to each generate_signal(..., pm=...)
+    so the portfolio is scanned once per bar instead of once per strategy.
+    """
+
+    unrealized_pnl: Optional[float]
+    last_entry_price: Optional[float]
+    last_trade_opened_at: Optional[datetime]
+    last_trade_opened_at_ts: Optional[float]
+    seconds_since_last_trade: Optional[float]
+    drawdown: dict
+
+    @classmethod
+    def compute(
+        cls,
+        portfolio_state: Optional[PortfolioState],
+        current_price: float,
+    ) -> PortfolioMetricsSnapshot:
+        unrealized = compute_unrealized_pnl(portfolio_state, current_price)
+        last_entry_price, opened_at, seconds_since = compute_last_trade_info(
+            portfolio_state
+        )
+        return cls(
+            unrealized_pnl=unrealized,
+            last_entry_price=last_entry_price,
+            last_trade_opened_at=opened_at,
+            last_trade_opened_at_ts=opened_at.timestamp() if opened_at else None,
+            seconds_since_last_trade=seconds_since,
+            drawdown=compute_drawdown_status(
+                portfolio_state,
+                unrealized_pnl=unrealized,
+            ),
+        )
@@ -1,13 +1,30 @@
+from datetime import datetime, timezone
+
 from bot.core.logger import get_logger
 from bot.persistence.db import DB
+from bot.persistence.writer import BulkWriter
+from bot.strategies.signals import StrategySignal
 
 logger = get_logger(__name__)
 
 
 class StrategyRunner:
-    def __init__(self, strategy, db: DB, portfolio_id: int, asset_id: int, strategy_config_id: int):
+    SIGNAL_FLUSH_SIZE = 500
+
+    def __init__(
+        self,
+        strategy,
+        db: DB,
+        portfolio_id: int,
+        asset_id: int,
+        strategy_config_id: int,
+        writer: BulkWriter | None = None,
+    ):
         self.strategy = strategy
         self.db = db
+        # Live mode: hand signals to a shared group-commit writer instead
+        # of buffering them per run.
+        self.writer = writer
         self.portfolio_id = portfolio_id
         self.asset_id = asset_id
         self.strategy_config_id = strategy_config_id
@@ -15,37 +32,71 @@ class StrategyRunner:
         # Prevent duplicate signals in a row
         self.last_signal_type = None
 
+        # Signals waiting to be written; flushed every SIGNAL_FLUSH_SIZE rows
+        # and at the end of each run.
+        self._signal_buffer: list[dict] = []
+
     async def run(self, candles):
         signals = []
 
-        for candle in candles:
-            # Load state on each step (live trading would optimize this)
-            portfolio_state = await self.db.load_portfolio_state(self.portfolio_id)
+        # Buffered signals are written even if a step below raises.
+        try:
+            for candle in candles:
+                # Load state on each step (live trading would optimize this)
+                portfolio_state = await self.db.load_portfolio_state(self.portfolio_id)
+
+                sig = self.strategy.generate_signal(candle, portfolio_state)
 
-            sig = self.strategy.generate_signal(candle, portfolio_state)
+                if sig is None:
+                    continue
 
-            if sig is None:
-                continue
+                # Avoid enter-enter or exit-exit spam
+                if sig.signal_type == self.last_signal_type:
+                    logger.debug("Skipping duplicate %s signal", sig.signal_type)
+                    continue
 
-            # Avoid enter-enter or exit-exit spam
-            if sig.signal_type == self.last_signal_type:
-                logger.debug(f"Skipping duplicate {sig.signal_type} signal")
-                continue
+                self.last_signal_type = sig.signal_type
 
-            self.last_signal_type = sig.signal_type
-            signals.append(sig)
+                if sig.timestamp is None:
+                    # The shared HOLD signal carries no time or price of its
+                    # own: callers and the stored row get a populated copy.
+                    sig = StrategySignal(
+                        timestamp=datetime.now(timezone.utc),
+                        signal_type=sig.signal_type,
+                        price=candle.close,
+                        metadata=sig.metadata,
+                    )
+                signals.append(sig)
 
-            logger.info(f"Recording {sig.signal_type.upper()} @ {sig.price}")
+                price = sig.price
 
-            # Save to DB
-            await self.db.record_signal(
-                portfolio_id=self.portfolio_id,
-                asset_id=self.asset_id,
-                strategy_config_id=self.strategy_config_id,
-                signal_type=sig.signal_type,
-                price=sig.price,
-                extra=sig.metadata,
-                timestamp=sig.timestamp,
-            )
+                logger.info("Recording %s @ %s", sig.signal_type.upper(), price)
+
+                row = {
+                    "portfolio_id": self.portfolio_id,
+                    "asset_id": self.asset_id,
+                    "strategy_config_id": self.strategy_config_id,
+                    "signal_type": sig.signal_type,
+                    "price": price,
+                    "extra": sig.metadata,
+                    "timestamp": sig.timestamp,
+                }
+                if self.writer is not None:
+                    self.writer.submit_signal(**row)
+                    continue
+
+                self._signal_buffer.append(row)
+                if len(self._signal_buffer) >= self.SIGNAL_FLUSH_SIZE:
+                    await self.flush()
+        finally:
+            await self.flush()
 
         return signals
+
+    async def flush(self):
+        """Write any buffered signals in one executemany INSERT."""
+        if not self._signal_buffer:
+            return
+        rows = self._signal_buffer
+        self._signal_buffer = []
+        await self.db.insert_signals(rows)
@@ -10,9 +10,9 @@ class SignalType:
     HOLD = "hold"
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategySignal:
-    timestamp: datetime
+    timestamp: Optional[datetime]  # None only on the shared HOLD (see base)
     signal_type: str               # enter | exit | hold
     price: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = None
@@ -0,0 +1,52 @@
+"""candles ohlcv as double precision
+
+Revision ID: 3f1c2a7d9b40
+Revises: 06d550bb635b
+Create Date: 2025-11-24 18:02:11.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a7d9b40'
+down_revision: Union[str, Sequence[str], None] = '06d550bb635b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for col in PRICE_COLUMNS + ('volume',):
+        op.alter_column(
+            'candles', col,
+            existing_type=sa.Numeric(),
+            type_=sa.Float(),
+            existing_nullable=True,
+            postgresql_using=f'{col}::double precision',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for col in PRICE_COLUMNS:
+        op.alter_column(
+            'candles', col,
+            existing_type=sa.Float(),
+            type_=sa.Numeric(precision=18, scale=8),
+            existing_nullable=True,
+            postgresql_using=f'{col}::numeric(18, 8)',
+        )
+    op.alter_column(
+        'candles', 'volume',
+        existing_type=sa.Float(),
+        type_=sa.Numeric(precision=28, scale=8),
+        existing_nullable=True,
+        postgresql_using='volume::numeric(28, 8)',
+    )
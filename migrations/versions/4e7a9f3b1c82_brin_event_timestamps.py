@@ -0,0 +1,43 @@
+"""brin indexes on risk event and error timestamps
+
+Revision ID: 4e7a9f3b1c82
+Revises: 9c6b2d0e4f18
+Create Date: 2025-12-01 09:52:14.337086
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7a9f3b1c82'
+down_revision: Union[str, Sequence[str], None] = '9c6b2d0e4f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_risk_events_triggered_brin',
+        'risk_events',
+        ['triggered_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index(
+        'ix_errors_occurred_brin',
+        'errors',
+        ['occurred_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_errors_occurred_brin', table_name='errors')
+    op.drop_index('ix_risk_events_triggered_brin', table_name='risk_events')
@@ -0,0 +1,49 @@
+"""signal metadata and risk event details as jsonb
+
+Revision ID: 5b9f04e6a3d7
+Revises: c7d2e91f0a15
+Create Date: 2025-11-26 11:23:08.551962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9f04e6a3d7'
+down_revision: Union[str, Sequence[str], None] = 'c7d2e91f0a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = (
+    ('signals', 'metadata'),
+    ('risk_events', 'details'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json',
+        )
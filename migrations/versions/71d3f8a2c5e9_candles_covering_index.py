@@ -0,0 +1,37 @@
+"""covering index for recent-candle reads
+
+Revision ID: 71d3f8a2c5e9
+Revises: e2a81c4f7b06
+Create Date: 2025-11-27 10:15:22.904511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '71d3f8a2c5e9'
+down_revision: Union[str, Sequence[str], None] = 'e2a81c4f7b06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_candles_aitf_ts_desc',
+            'candles',
+            ['asset_id', 'timeframe', sa.text('timestamp DESC')],
+            unique=False,
+            postgresql_include=['open', 'high', 'low', 'close', 'volume'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_candles_aitf_ts_desc', table_name='candles', postgresql_concurrently=True)
@@ -0,0 +1,57 @@
+"""indexes for snapshot, open order and open trade lookups
+
+Revision ID: 8a4e5b1c2d63
+Revises: 3f1c2a7d9b40
+Create Date: 2025-11-25 09:41:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4e5b1c2d63'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a7d9b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_snapshots_pf_date_desc',
+            'daily_snapshots',
+            ['portfolio_id', sa.text('date DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_orders_open_lookup',
+            'orders',
+            ['portfolio_id', 'asset_id'],
+            unique=False,
+            postgresql_where=sa.text(
+                "status IN ('open', 'pending', 'partially_filled')"
+            ),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_trades_open',
+            'trades',
+            ['portfolio_id'],
+            unique=False,
+            postgresql_where=sa.text('closed_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_trades_open', table_name='trades', postgresql_concurrently=True)
+        op.drop_index('ix_orders_open_lookup', table_name='orders', postgresql_concurrently=True)
+        op.drop_index('ix_snapshots_pf_date_desc', table_name='daily_snapshots', postgresql_concurrently=True)
@@ -0,0 +1,147 @@
+"""partition candles by timeframe
+
+Revision ID: 9c6b2d0e4f18
+Revises: 71d3f8a2c5e9
+Create Date: 2025-11-28 13:37:45.610293
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c6b2d0e4f18'
+down_revision: Union[str, Sequence[str], None] = '71d3f8a2c5e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# One partition per timeframe we ingest; anything else lands in the default.
+TIMEFRAMES = ('1m', '5m', '15m', '1h', '4h', '1d')
+
+CANDLE_COLUMNS = (
+    'id, asset_id, timeframe, timestamp, open, high, low, close, volume, '
+    'source, created_at'
+)
+
+
+def _partition_name(timeframe: str) -> str:
+    return f'candles_{timeframe}'
+
+
+def _retire_table(new_name: str, indexes: Sequence[str]) -> None:
+    """
+    Move the current candles table out of the way, freeing the index and
+    constraint names (they share the relation namespace) for its replacement.
+    """
+    op.rename_table('candles', new_name)
+    op.execute(f'ALTER SEQUENCE candles_id_seq RENAME TO {new_name}_id_seq')
+    op.execute(f'ALTER TABLE {new_name} RENAME CONSTRAINT candles_pkey TO {new_name}_pkey')
+    op.execute(
+        f'ALTER TABLE {new_name} RENAME CONSTRAINT '
+        f'candles_asset_id_timeframe_timestamp_key TO {new_name}_aitf_ts_key'
+    )
+    for name in indexes:
+        op.drop_index(name, table_name=new_name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A regular table cannot be converted in place: build the partitioned
+    # table next to it, copy the rows over, then swap.
+    _retire_table('candles_unpartitioned', ['ix_candles_aitf_ts_desc'])
+
+    op.create_table('candles',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('asset_id', sa.Integer(), nullable=False),
+    sa.Column('timeframe', sa.String(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('open', sa.Float(), nullable=True),
+    sa.Column('high', sa.Float(), nullable=True),
+    sa.Column('low', sa.Float(), nullable=True),
+    sa.Column('close', sa.Float(), nullable=True),
+    sa.Column('volume', sa.Float(), nullable=True),
+    sa.Column('source', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ),
+    sa.PrimaryKeyConstraint('id', 'timeframe'),
+    sa.UniqueConstraint('asset_id', 'timeframe', 'timestamp'),
+    postgresql_partition_by='LIST (timeframe)',
+    )
+
+    for tf in TIMEFRAMES:
+        op.execute(
+            f"CREATE TABLE {_partition_name(tf)} PARTITION OF candles "
+            f"FOR VALUES IN ('{tf}')"
+        )
+    op.execute('CREATE TABLE candles_default PARTITION OF candles DEFAULT')
+
+    # Indexes on the parent are created on every partition automatically.
+    op.create_index(
+        'ix_candles_aitf_ts_desc',
+        'candles',
+        ['asset_id', 'timeframe', sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_include=['open', 'high', 'low', 'close', 'volume'],
+    )
+    op.create_index(
+        'ix_candles_ts_brin',
+        'candles',
+        ['timestamp'],
+        unique=False,
+        postgresql_using='brin',
+    )
+
+    op.execute(
+        f'INSERT INTO candles ({CANDLE_COLUMNS}) '
+        f'SELECT {CANDLE_COLUMNS} FROM candles_unpartitioned'
+    )
+    op.execute(
+        "SELECT setval('candles_id_seq', "
+        "COALESCE((SELECT MAX(id) FROM candles), 0) + 1, false)"
+    )
+    op.drop_table('candles_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _retire_table(
+        'candles_partitioned',
+        ['ix_candles_aitf_ts_desc', 'ix_candles_ts_brin'],
+    )
+
+    op.create_table('candles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('asset_id', sa.Integer(), nullable=False),
+    sa.Column('timeframe', sa.String(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('open', sa.Float(), nullable=True),
+    sa.Column('high', sa.Float(), nullable=True),
+    sa.Column('low', sa.Float(), nullable=True),
+    sa.Column('close', sa.Float(), nullable=True),
+    sa.Column('volume', sa.Float(), nullable=True),
+    sa.Column('source', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['asset_id'], ['assets.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('asset_id', 'timeframe', 'timestamp')
+    )
+    op.create_index(
+        'ix_candles_aitf_ts_desc',
+        'candles',
+        ['asset_id', 'timeframe', sa.text('timestamp DESC')],
+        unique=False,
+        postgresql_include=['open', 'high', 'low', 'close', 'volume'],
+    )
+
+    op.execute(
+        f'INSERT INTO candles ({CANDLE_COLUMNS}) '
+        f'SELECT {CANDLE_COLUMNS} FROM candles_partitioned'
+    )
+    op.execute(
+        "SELECT setval('candles_id_seq', "
+        "COALESCE((SELECT MAX(id) FROM candles), 0) + 1, false)"
+    )
+    op.drop_table('candles_partitioned')
@@ -0,0 +1,47 @@
+"""server-side now() defaults for signal/risk/error timestamps
+
+Revision ID: c7d2e91f0a15
+Revises: 8a4e5b1c2d63
+Create Date: 2025-11-25 14:06:52.730419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e91f0a15'
+down_revision: Union[str, Sequence[str], None] = '8a4e5b1c2d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = (
+    ('signals', 'timestamp'),
+    ('risk_events', 'triggered_at'),
+    ('errors', 'occurred_at'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+        )
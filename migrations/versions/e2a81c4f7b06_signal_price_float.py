@@ -0,0 +1,40 @@
+"""signal price as double precision
+
+Revision ID: e2a81c4f7b06
+Revises: 5b9f04e6a3d7
+Create Date: 2025-11-26 16:48:40.209377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a81c4f7b06'
+down_revision: Union[str, Sequence[str], None] = '5b9f04e6a3d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'signals', 'price',
+        existing_type=sa.Numeric(precision=18, scale=8),
+        type_=sa.Float(),
+        existing_nullable=True,
+        postgresql_using='price::double precision',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'signals', 'price',
+        existing_type=sa.Float(),
+        type_=sa.Numeric(precision=18, scale=8),
+        existing_nullable=True,
+        postgresql_using='price::numeric(18, 8)',
+    )
@@ -0,0 +1,52 @@
+import unittest
+from collections import deque
+
+from bot.strategies.indicators.ringbuffer import RingBuffer
+
+
+class RingBufferTests(unittest.TestCase):
+    def test_matches_bounded_deque_across_wraparound(self):
+        buf = RingBuffer(5)
+        ref: deque = deque(maxlen=5)
+
+        for k in range(23):
+            value = float(k * k % 17)
+            evicted = buf.append(value)
+            expected = ref[0] if len(ref) == ref.maxlen else None
+            ref.append(value)
+
+            self.assertEqual(evicted, expected)
+            self.assertEqual(len(buf), len(ref))
+            self.assertEqual(list(buf), list(ref))
+            self.assertEqual([buf[i] for i in range(len(buf))], list(ref))
+            self.assertEqual(buf[-1], ref[-1])
+            self.assertEqual(buf[0], ref[0])
+            self.assertEqual(buf[1:-1], list(ref)[1:-1])
+
+    def test_index_out_of_range(self):
+        buf = RingBuffer(3)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            buf.append(value)
+
+        with self.assertRaises(IndexError):
+            buf[3]
+        with self.assertRaises(IndexError):
+            buf[-4]
+
+    def test_clear_then_refill(self):
+        buf = RingBuffer(3)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            buf.append(value)
+        buf.clear()
+
+        self.assertEqual(len(buf), 0)
+        self.assertIsNone(buf.append(9.0))
+        self.assertEqual(list(buf), [9.0])
+
+    def test_rejects_non_positive_capacity(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import math
+import random
+import unittest
+
+from bot.strategies.indicators.moving_averages import StreamingSMA, sma
+from bot.strategies.indicators.volatility import StreamingVolatility, volatility_stddev
+
+
+def _walk(n, seed, bad_every=0):
+    """Geometric random walk; every `bad_every`-th close is non-positive."""
+    rng = random.Random(seed)
+    price = 100.0
+    closes = []
+    for i in range(1, n + 1):
+        price *= math.exp(rng.gauss(0.0, 0.02))
+        closes.append(0.0 if bad_every and i % bad_every == 0 else price)
+    return closes
+
+
+class StreamingSMATests(unittest.TestCase):
+    def test_matches_sma_on_every_prefix(self):
+        closes = _walk(3000, seed=1)  # long enough to pass a resync
+        for window in (1, 5, 20):
+            stream = StreamingSMA(window)
+            for i, close in enumerate(closes):
+                got = stream.update(close)
+                want = sma(closes[: i + 1], window)
+                if want is None:
+                    self.assertIsNone(got)
+                else:
+                    self.assertAlmostEqual(got, want, delta=1e-9 * abs(want))
+
+
+class StreamingVolatilityTests(unittest.TestCase):
+    def _check(self, closes, window):
+        stream = StreamingVolatility(window)
+        for i, close in enumerate(closes):
+            got = stream.update(close)
+            want = volatility_stddev(closes[: i + 1], window)
+            if want is None:
+                self.assertIsNone(got, f"bar {i}")
+            else:
+                # Compared as variances: the running M2 carries rounding
+                # residue that sqrt() would magnify near zero.
+                self.assertAlmostEqual(got**2, want**2, delta=1e-12, msg=f"bar {i}")
+
+    def test_matches_volatility_stddev(self):
+        closes = _walk(600, seed=2)
+        for window in (1, 3, 20):
+            self._check(closes, window)
+
+    def test_undefined_returns_leave_and_rejoin_the_window(self):
+        closes = _walk(400, seed=3, bad_every=37)
+        for window in (2, 10):
+            self._check(closes, window)
+
+
+if __name__ == "__main__":
+    unittest.main()